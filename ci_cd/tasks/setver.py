@@ -9,6 +9,8 @@ import logging
 import re
 import sys
 import traceback
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -186,41 +188,52 @@ replacement (handled): %s
             f"{Emoji.CROSS_MARK.value} Errors occurred! See printed statements above."
         )
 
-    for (
-        filepath,
-        pattern,
-        replacement,
-        input_replacement,
-    ) in validated_code_base_updates:
-        if test:
-            print(
-                f"filepath: {filepath}\npattern: {pattern!r}\n"
-                f"replacement (input): {input_replacement}\n"
-                f"replacement (handled): {replacement}"
-            )
-            continue
+    # Consecutive updates of the same file are applied with a single read and write
+    for filepath, file_updates in groupby(
+        validated_code_base_updates, key=itemgetter(0)
+    ):
+        sub_lines: list[tuple[str, str]] = []
+        for _, pattern, replacement, input_replacement in file_updates:
+            if test:
+                print(
+                    f"filepath: {filepath}\npattern: {pattern!r}\n"
+                    f"replacement (input): {input_replacement}\n"
+                    f"replacement (handled): {replacement}"
+                )
+                continue
+
+            try:
+                # Substituting in an empty string compiles both the pattern and the
+                # replacement template, without touching the file
+                re.compile(pattern).sub(replacement, "")
+            except re.error as exc:
+                # Apply the preceding valid updates of this file before stopping
+                if sub_lines:
+                    update_file(filepath, sub_lines)
+
+                msg = ""
+
+                if validated_code_base_updates[0] != (
+                    filepath,
+                    pattern,
+                    replacement,
+                    input_replacement,
+                ):
+                    msg += "Some files have already been updated !\n\n "
+
+                msg += (
+                    f"Could not update file {filepath} according to the given input:"
+                    f"\n\n  pattern: {pattern}\n  replacement: {replacement}\n\n"
+                    f"Exception: {exc}"
+                )
+                LOGGER.error(msg)
+                LOGGER.debug("Traceback: %s", traceback.format_exc())
+                sys.exit(f"{Emoji.CROSS_MARK.value} {error_msg(msg)}")
 
-        try:
-            update_file(filepath, (pattern, replacement))
-        except re.error as exc:
-            msg = ""
+            sub_lines.append((pattern, replacement))
 
-            if validated_code_base_updates[0] != (
-                filepath,
-                pattern,
-                replacement,
-                input_replacement,
-            ):
-                msg += "Some files have already been updated !\n\n "
-
-            msg += (
-                f"Could not update file {filepath} according to the given input:\n\n  "
-                f"pattern: {pattern}\n  replacement: {replacement}\n\nException: "
-                f"{exc}"
-            )
-            LOGGER.error(msg)
-            LOGGER.debug("Traceback: %s", traceback.format_exc())
-            sys.exit(f"{Emoji.CROSS_MARK.value} {error_msg(msg)}")
+        if sub_lines:
+            update_file(filepath, sub_lines)
 
     # Success, done
     print(
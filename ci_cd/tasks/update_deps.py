@@ -5,18 +5,26 @@ Update dependencies in a `pyproject.toml` file.
 
 from __future__ import annotations
 
+import json
 import logging
+import os
 import re
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
+from urllib.request import urlopen
 
 import tomlkit
 from invoke import task
 from packaging.markers import default_environment
 from packaging.requirements import InvalidRequirement, Requirement
+from packaging.specifiers import InvalidSpecifier, SpecifierSet
+from packaging.utils import canonicalize_name
 from packaging.version import InvalidVersion, Version
-from tomlkit.exceptions import TOMLKitError
 
 from ci_cd.exceptions import InputError, UnableToResolve
 from ci_cd.utils import (
@@ -30,15 +38,31 @@ from ci_cd.utils import (
     parse_ignore_entries,
     parse_ignore_rules,
     regenerate_requirement,
-    update_file,
     update_specifier_set,
     warning_msg,
 )
 
+# Read pyproject.toml with the faster, read-only TOML parser of the standard library if
+# available. tomlkit is then only used when writing updates.
+if sys.version_info >= (3, 11):
+    from tomllib import TOMLDecodeError
+    from tomllib import loads as load_toml
+else:  # pragma: no cover
+    from tomlkit import loads as load_toml
+    from tomlkit.exceptions import TOMLKitError as TOMLDecodeError
+
 if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Iterator
+    from concurrent.futures import Future
+    from typing import Any
+
     from invoke import Context, Result
 
-    from ci_cd.utils.versions import IgnoreUpdateTypes, IgnoreVersions
+    from ci_cd.utils.versions import (
+        IgnoreRulesCollection,
+        IgnoreUpdateTypes,
+        IgnoreVersions,
+    )
 
 
 # Get logger
@@ -56,87 +80,553 @@ See PEP 508 for more information, as well as the packaging documentation:
 https://packaging.python.org/en/latest/specifications/name-normalization/
 """
 
+PIP_INDEX_VERSIONS_PATTERN = re.compile(r"(?P<package>\S+) \((?P<version>\S+)\)")
+"""
+Pattern to retrieve the package name and latest version from the first line of the
+human-readable `pip index versions` output.
+"""
+
+PIP_INDEX_MAX_WORKERS = 16
+"""Maximum number of concurrent latest version lookups, e.g., `pip index versions`
+calls."""
+
+PYPI_JSON_API_URL = "https://pypi.org/pypi/{name}/json"
+"""URL template for PyPI's JSON API for a package."""
+
+PYPI_JSON_API_TIMEOUT = 30
+"""Timeout in seconds for requests to PyPI's JSON API."""
+
+LATEST_VERSIONS_CACHE_TTL = 3600
+"""Time in seconds for which a cached latest version of a package is used."""
+
+EMPTY_MARKER_ENVIRONMENT: dict[str, str] = dict.fromkeys(default_environment(), "")
+"""
+Marker environment with all values empty.
+
+Used as a template for evaluating markers solely based on the Python version, since
+any environment markers not given when evaluating are taken from the current
+environment.
+"""
+
+SPECIFIER_OPERATOR_ORDER: dict[str, int] = {
+    "~=": 0,
+    ">=": 1,
+    ">": 2,
+    "===": 3,
+    "==": 4,
+    "<=": 5,
+    "<": 6,
+    "!=": 7,
+}
+"""
+Order of version specifiers, by operator, in the summary of updated dependencies.
+"""
+
+
+class _ParsedDependency(NamedTuple):
+    """A dependency from `pyproject.toml` along with its parsed information.
+
+    The `marker_py_version` is the Python version to use according to the
+    requirement's markers (see `_marker_py_version()`), or the exception raised if it
+    cannot be determined.
+    """
+
+    raw: str
+    requirement: Requirement | InvalidRequirement
+    post_name_space: bool
+    marker_py_version: str | UnableToResolve
+
+
+def _parse_dependency(
+    dependency: str,
+    requirement: Requirement | InvalidRequirement,
+    py_version: str,
+) -> _ParsedDependency:
+    """Gather the parsed information of a dependency.
+
+    The Python version to use according to the requirement's markers is determined
+    only here, as it is needed both when looking up the latest version and when
+    handling the dependency. Should it not be possible to determine, the exception is
+    kept, to be reported when handling the dependency.
+    """
+    if isinstance(requirement, InvalidRequirement):
+        return _ParsedDependency(dependency, requirement, False, "")
+
+    marker_py_version: str | UnableToResolve
+    try:
+        marker_py_version = _marker_py_version(requirement, py_version)
+    except UnableToResolve as exc:
+        marker_py_version = exc
+
+    return _ParsedDependency(
+        dependency,
+        requirement,
+        _has_post_name_space(dependency, requirement.name),
+        marker_py_version,
+    )
+
+
+def _has_post_name_space(dependency: str, name: str) -> bool:
+    """Determine whether a dependency has white space after its (parsed) name.
+
+    The name may be followed by extras, in which case the white space after the extras
+    is also considered.
+
+    This is a plain string scan, as the dependency is known to start with the name.
+    """
+    rest = dependency.lstrip(" \t")[len(name) :]
+    if rest[:1] in (" ", "\t"):
+        return True
+    if rest[:1] == "[":
+        extras_end = rest.find("]")
+        return extras_end != -1 and rest[extras_end + 1 : extras_end + 2] in (" ", "\t")
+    return False
+
+
+@lru_cache(maxsize=None)
+def _parse_requirement(dependency: str) -> Requirement:
+    """Parse a dependency string into a requirement (cached).
+
+    NOTE: The returned requirement is shared between calls, and must not be mutated.
+    """
+    return Requirement(dependency)
+
+
+@lru_cache(maxsize=4096)
+def _parse_version(version: str) -> Version:
+    """Parse a version string (cached)."""
+    return Version(version)
+
+
+def _unique_requirements(
+    dependencies: Iterable[str],
+) -> Iterator[tuple[str, Requirement | InvalidRequirement]]:
+    """Lazily parse dependencies, yielding each requirement only once.
+
+    Only the first occurrence of a requirement is yielded, while later (equal)
+    occurrences, e.g., in several optional dependency groups, are dropped.
+    Dependencies that cannot be parsed are yielded together with the raised exception
+    instead of a requirement.
+    """
+    requirements: set[Requirement] = set()
+    for dependency in dependencies:
+        try:
+            requirement = _parse_requirement(dependency)
+        except InvalidRequirement as exc:
+            yield dependency, exc
+            continue
+
+        if requirement in requirements:
+            LOGGER.debug("Skipping duplicate requirement: %r", dependency)
+            continue
+
+        requirements.add(requirement)
+        yield dependency, requirement
+
+
+def _is_unconditionally_ignored(version_rules: IgnoreVersions) -> bool:
+    """Determine whether the `versions` ignore rules match any and all versions.
+
+    This is the case for ignore rules given with only a `dependency-name`, which are
+    parsed as the single `versions` rule `>=0`.
+    Since `versions` rules must all match for a version to be ignored, this is true
+    only if all rules are `>=0`.
+    """
+    return bool(version_rules) and all(
+        rule == {"operator": ">=", "version": "0"} for rule in version_rules
+    )
+
+
+def _write_messages(messages: list[str], stderr: bool = False) -> None:
+    """Write accumulated console messages to stdout (or stderr) in a single call.
+
+    The list of messages is emptied afterwards.
+    """
+    if messages:
+        (sys.stderr if stderr else sys.stdout).write("\n".join(messages) + "\n")
+        messages.clear()
+
+
+def _parse_pip_index_versions(output: str) -> str | None:
+    """Retrieve the latest version from the output of `pip index versions`.
+
+    The output is parsed as JSON if `--json` was supported (pip 25.1+), using the
+    `latest` version, or else the first (newest) of the listed `versions`.
+    Otherwise, the first line of the human-readable output, `<package> (<version>)`,
+    is parsed.
+
+    Returns `None` if the latest version cannot be retrieved from the output.
+    """
+    if output.lstrip().startswith("{"):
+        try:
+            index_versions = json.loads(output)
+            latest_version = (
+                index_versions.get("latest") or index_versions["versions"][0]
+            )
+        except (json.JSONDecodeError, AttributeError, KeyError, IndexError, TypeError):
+            return None
+        return latest_version if isinstance(latest_version, str) else None
+
+    # The pattern cannot match beyond the first line
+    match = PIP_INDEX_VERSIONS_PATTERN.match(output)
+    return None if match is None else match.group("version")
+
+
+def _scan_specifier_set(
+    specifier_set: SpecifierSet, latest_version: Version
+) -> tuple[bool, list[str] | None]:
+    """Scan a specifier set for whether it already uses the latest version, as well as
+    for its "current" version, in a single pass.
+
+    The specifier set is expected to already use the latest version if the latest
+    version equals a specifier with any of the operators: ==, >=, or ~=, up to the
+    specifier version's number of release parts.
+    Only plain release versions (possibly with an epoch) are compared, i.e., not,
+    e.g., pre-releases or wildcard versions.
+
+    The "current" version is the version of the first specifier with any of these
+    operators, split into its parts, or `None` if there is no such specifier.
+
+    Returns:
+        Whether the specifier set is up-to-date, and the "current" version parts.
+
+    """
+    current_version: list[str] | None = None
+    latest_release = latest_version.release
+    for specifier in specifier_set:
+        if specifier.operator not in ("==", ">=", "~="):
+            continue
+
+        if current_version is None:
+            current_version = specifier.version.split(".")
+
+        try:
+            specifier_version = _parse_version(specifier.version)
+        except InvalidVersion:
+            continue
+
+        if (
+            specifier_version.epoch == latest_version.epoch
+            and specifier_version.base_version == str(specifier_version)
+            and latest_release[: len(specifier_version.release)]
+            == specifier_version.release
+        ):
+            return True, current_version
+    return False, current_version
+
+
+def _user_ignore_rules(
+    name: str,
+    ignore_rules: IgnoreRulesCollection,
+    wildcard_ignore_rules: tuple[IgnoreVersions, IgnoreUpdateTypes] | None,
+    parsed_ignore_rules: dict[str, tuple[IgnoreVersions, IgnoreUpdateTypes]],
+) -> tuple[IgnoreVersions, IgnoreUpdateTypes]:
+    """Gather the user-supplied ignore rules for a package.
+
+    The package-specific ignore rules are parsed only once and stored in
+    `parsed_ignore_rules`.
+    """
+    versions: IgnoreVersions = []
+    update_types: IgnoreUpdateTypes = {}
+
+    if wildcard_ignore_rules is not None:
+        versions.extend(wildcard_ignore_rules[0])
+        update_types.update(wildcard_ignore_rules[1])
+
+    if name in ignore_rules:
+        if name not in parsed_ignore_rules:
+            parsed_ignore_rules[name] = parse_ignore_rules(ignore_rules[name])
+        parsed_rules = parsed_ignore_rules[name]
+
+        versions.extend(parsed_rules[0])
+        update_types.update(parsed_rules[1])
+
+    return versions, update_types
+
+
+def _marker_py_version(requirement: Requirement, py_version: str) -> str:
+    """Determine the Python version to use for a requirement based on its markers.
+
+    An empty string is returned if the requirement has no markers, or if its markers
+    do not concern the `python_version`, e.g., `sys_platform == 'win32'`.
+    """
+    if not requirement.marker or "python_version" not in str(requirement.marker):
+        return ""
+
+    python_version_centric_environment = {
+        **EMPTY_MARKER_ENVIRONMENT,
+        "python_version": py_version,
+    }
+
+    if not requirement.marker.evaluate(environment=python_version_centric_environment):
+        # Current (minimum) Python version does NOT satisfy the marker
+        return find_minimum_py_version(
+            marker=requirement.marker,
+            project_py_version=py_version,
+        )
+    return get_min_max_py_version(requirement.marker)
+
+
+def _pip_index_versions(
+    context: Context, name: str, py_version: str, json_output: bool
+) -> str:
+    """Run `pip index versions` for a package and Python version and return its
+    output.
+
+    If `json_output` is true, JSON output is requested (`--json`, pip 25.1+).
+    Should the installed pip not support this, the human-readable output is returned
+    instead.
+    """
+    arguments = f"--python-version {py_version} {name}"
+
+    # Note: No input is needed, and several commands may run concurrently. Mirroring
+    # stdin would start a thread per command, each saving and restoring the terminal
+    # mode, which is not thread-safe.
+    if json_output:
+        result = context.run(
+            f"pip index versions --json {arguments}",
+            hide=True,
+            warn=True,
+            in_stream=False,
+        )
+        if result is not None and not result.failed:
+            return result.stdout
+        if result is not None and "--json" in result.stderr:
+            LOGGER.debug(
+                "'pip index versions' does not support '--json'. Falling back to "
+                "parsing its human-readable output."
+            )
+
+    result = context.run(f"pip index versions {arguments}", hide=True, in_stream=False)
+    return result.stdout if result is not None else ""
+
+
+def _pypi_json_api_versions(name: str, py_version: str) -> str:
+    """Retrieve the available versions of a package from PyPI's JSON API.
+
+    Similar to `pip index versions`, only final releases with a non-yanked
+    distribution file supporting the given Python version are considered.
+    The returned output mimics the output of `pip index versions --json`.
+
+    Raises:
+        UnableToResolve: If the package information cannot be retrieved, or no
+            version of the package supports the given Python version.
+
+    """
+    try:
+        # The URL is the fixed 'https://pypi.org' template, with only the (parsed)
+        # package name filled in
+        with urlopen(  # nosec B310
+            PYPI_JSON_API_URL.format(name=name), timeout=PYPI_JSON_API_TIMEOUT
+        ) as response:
+            releases: dict[str, list[dict[str, Any]]] = json.load(response).get(
+                "releases", {}
+            )
+    except (OSError, ValueError) as exc:
+        raise UnableToResolve(
+            f"Could not retrieve package information from {PYPI_JSON_API_URL}: {exc}"
+        ) from exc
+
+    python_version = _parse_version(py_version)
+    python_version_support: dict[str, bool] = {}
+
+    def _supports_python_version(requires_python: str | None) -> bool:
+        """Whether a `requires_python` value of a distribution file is satisfied."""
+        if not requires_python:
+            return True
+        if requires_python not in python_version_support:
+            try:
+                python_version_support[requires_python] = SpecifierSet(
+                    requires_python
+                ).contains(python_version)
+            except InvalidSpecifier:
+                # Invalid values are ignored, as is done by pip
+                python_version_support[requires_python] = True
+        return python_version_support[requires_python]
+
+    versions: list[Version] = []
+    for raw_version, files in releases.items():
+        try:
+            version = _parse_version(raw_version)
+        except InvalidVersion:
+            continue
+        if version.is_prerelease or not any(
+            not file.get("yanked", False)
+            and _supports_python_version(file.get("requires_python"))
+            for file in files
+        ):
+            continue
+        versions.append(version)
+
+    if not versions:
+        raise UnableToResolve(
+            f"No version of package {name!r} supporting Python {py_version} found on "
+            "PyPI."
+        )
+
+    versions.sort(reverse=True)
+    return json.dumps(
+        {
+            "name": name,
+            "versions": [str(version) for version in versions],
+            "latest": str(versions[0]),
+        }
+    )
+
+
+def _latest_versions_cache_path() -> Path:
+    """Path to the on-disk cache of latest package versions.
+
+    The cache directory can be set with the `CI_CD_CACHE_DIR` environment variable.
+    Otherwise, `ci-cd` under `$XDG_CACHE_HOME` (defaulting to `~/.cache`) is used.
+    """
+    cache_dir = os.getenv("CI_CD_CACHE_DIR") or (
+        Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "ci-cd"
+    )
+    return Path(cache_dir) / "latest_versions.json"
+
+
+def _latest_versions_cache_key(name: str, py_version: str, pypi_json_api: bool) -> str:
+    """Key of a package's latest version for a Python version in the cache.
+
+    The key includes the source of the latest version, as `pip index versions` uses
+    the configured package index, which need not be PyPI.
+    """
+    source = "pypi-json-api" if pypi_json_api else "pip-index"
+    return f"{source}|{canonicalize_name(name)}|{py_version}"
+
+
+def _load_latest_versions_cache(path: Path) -> dict[str, tuple[str, float]]:
+    """Load the non-expired entries of the on-disk cache of latest package versions.
+
+    The cache maps a key (see `_latest_versions_cache_key()`) to the latest version and
+    the time it was retrieved.
+    A missing or invalid cache is considered empty.
+    """
+    try:
+        raw_cache = json.loads(path.read_text(encoding="utf8"))
+    except (OSError, ValueError) as exc:
+        LOGGER.debug("Could not load latest versions cache at %s: %s", path, exc)
+        return {}
+
+    if not isinstance(raw_cache, dict):
+        return {}
+
+    now = time.time()
+    cache: dict[str, tuple[str, float]] = {}
+    for key, entry in raw_cache.items():
+        if (
+            isinstance(entry, list)
+            and len(entry) == 2
+            and isinstance(entry[0], str)
+            and isinstance(entry[1], (int, float))
+            and now - entry[1] < LATEST_VERSIONS_CACHE_TTL
+        ):
+            cache[key] = (entry[0], entry[1])
+    return cache
+
+
+def _save_latest_versions_cache(
+    path: Path, cache: dict[str, tuple[str, float]]
+) -> None:
+    """Save the on-disk cache of latest package versions.
+
+    The file is replaced atomically. Failing to save the cache is not an error.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        temporary_path.write_text(json.dumps(cache), encoding="utf8")
+        temporary_path.replace(path)
+    except OSError as exc:
+        LOGGER.debug("Could not save latest versions cache at %s: %s", path, exc)
+
 
 def _format_and_update_dependency(
-    requirement: Requirement, raw_dependency_line: str, pyproject_path: Path
+    requirement: Requirement,
+    raw_dependency_line: str,
+    substitutions: dict[str, str],
+    post_name_space: bool,
 ) -> None:
     """Regenerate dependency without changing anything but the formatting.
 
+    The regenerated dependency is added to `substitutions`, if the formatting has
+    changed.
+
     NOTE: If any white space is present after the name (incl. possible extras) it is
     reduced to a single space.
     """
-    match = re.search(rf"{requirement.name}(?:\[.*\])?\s+", raw_dependency_line)
+    if raw_dependency_line == requirement.name:
+        # A bare package name, e.g., of an unrestricted dependency, is already formatted
+        return
+
     updated_dependency = regenerate_requirement(
         requirement,
-        post_name_space=bool(match),
+        post_name_space=post_name_space,
     )
     LOGGER.debug("Regenerated dependency: %r", updated_dependency)
     if updated_dependency != raw_dependency_line:
         # Update pyproject.toml since the dependency formatting has changed
         LOGGER.debug("Updating pyproject.toml for %r", requirement.name)
-        update_file(
-            pyproject_path,
-            (re.escape(raw_dependency_line), updated_dependency.replace('"', "'")),
-        )
+        substitutions[raw_dependency_line] = updated_dependency
 
 
-@task(
-    help={
-        "fail-fast": (
-            "Fail immediately if an error occurs. Otherwise, print and ignore all "
-            "non-critical errors."
-        ),
-        "root-repo-path": (
-            "A resolvable path to the root directory of the repository folder."
-        ),
-        "pre-commit": "Whether or not this task is run as a pre-commit hook.",
-        "ignore": (
-            "Ignore-rules based on the `ignore` config option of Dependabot. It "
-            "should be of the format: key=value...key=value, i.e., an ellipsis "
-            "(`...`) separator and then equal-sign-separated key/value-pairs. "
-            "Alternatively, the `--ignore-separator` can be set to something else to "
-            "overwrite the ellipsis. The only supported keys are: `dependency-name`, "
-            "`versions`, and `update-types`. Can be supplied multiple times per "
-            "`dependency-name`."
-        ),
-        "ignore-separator": (
-            "Value to use instead of ellipsis (`...`) as a separator in `--ignore` "
-            "key/value-pairs."
-        ),
-        "verbose": "Whether or not to print debug statements.",
-        "skip-unnormalized-python-package-names": (
-            "Whether to skip dependencies with unnormalized Python package names. "
-            "Normalization is outlined here: "
-            "https://packaging.python.org/en/latest/specifications/name-normalization."
-        ),
-    },
-    iterable=["ignore"],
-)
-def update_deps(
-    context,
-    root_repo_path=".",
-    fail_fast=False,
-    pre_commit=False,
-    ignore=None,
-    ignore_separator="...",
-    verbose=False,
-    skip_unnormalized_python_package_names=False,
-):
-    """Update dependencies in specified Python package's `pyproject.toml`."""
-    if TYPE_CHECKING:  # pragma: no cover
-        context: Context = context  # type: ignore[no-redef]
-        root_repo_path: str = root_repo_path  # type: ignore[no-redef]
-        fail_fast: bool = fail_fast  # type: ignore[no-redef]
-        pre_commit: bool = pre_commit  # type: ignore[no-redef]
-        ignore_separator: str = ignore_separator  # type: ignore[no-redef]
-        verbose: bool = verbose  # type: ignore[no-redef]
-        skip_unnormalized_python_package_names: bool = (  # type: ignore[no-redef]
-            skip_unnormalized_python_package_names
-        )
+def _update_pyproject(
+    pyproject_path: Path, pyproject_content: str, substitutions: dict[str, str]
+) -> None:
+    """Apply accumulated dependency substitutions to `pyproject.toml`.
+
+    The already read content of the file is parsed with tomlkit and the dependencies
+    are replaced in the parsed document, which is then written in one go, preserving its
+    formatting and comments.
+    All occurrences of a dependency are replaced, e.g., if it is listed in several
+    optional dependency groups.
+
+    The dict of substitutions is emptied afterwards.
+    """
+    if not substitutions:
+        return
 
-    if not ignore:
-        ignore: list[str] = []  # type: ignore[no-redef]
+    pyproject = tomlkit.parse(pyproject_content)
+    project = pyproject.get("project", {})
+    for dependency_array in chain(
+        [project.get("dependencies", [])],
+        project.get("optional-dependencies", {}).values(),
+    ):
+        for index, dependency in enumerate(dependency_array):
+            if dependency not in substitutions:
+                continue
+
+            if dependency.as_string().startswith("'"):
+                # Literal strings may contain double quotes, but not single quotes
+                dependency_array[index] = tomlkit.string(
+                    substitutions[dependency], literal=True
+                )
+            else:
+                dependency_array[index] = tomlkit.string(
+                    substitutions[dependency].replace('"', "'")
+                )
+
+    pyproject_path.write_text(tomlkit.dumps(pyproject), encoding="utf8")
+    substitutions.clear()
+
+
+def _run_update_deps(
+    context: Context,
+    root_repo_path: str,
+    fail_fast: bool,
+    pre_commit: bool,
+    ignore: list[str],
+    ignore_separator: str,
+    verbose: bool,
+    skip_unnormalized_python_package_names: bool,
+    pypi_json_api: bool = False,
+    cache: bool = True,
+) -> None:
+    """Update dependencies in specified Python package's `pyproject.toml`.
 
+    This is the implementation of the `update_deps` task, which only wraps it.
+    """
     if verbose:
         LOGGER.addHandler(logging.StreamHandler(sys.stdout))
         LOGGER.debug("Verbose logging enabled.")
@@ -152,7 +642,9 @@ def update_deps(
 
     if pre_commit and root_repo_path == ".":
         # Use git to determine repo root
-        result: Result = context.run("git rev-parse --show-toplevel", hide=True)
+        result: Result = context.run(  # type: ignore[assignment]
+            "git rev-parse --show-toplevel", hide=True
+        )
         root_repo_path = result.stdout.strip("\n")
 
     pyproject_path = Path(root_repo_path).resolve() / "pyproject.toml"
@@ -163,19 +655,21 @@ def update_deps(
         )
 
     # Parse pyproject.toml
+    # The content is kept to apply the dependency substitutions without reading it again
+    pyproject_content = pyproject_path.read_text(encoding="utf8")
     try:
-        pyproject = tomlkit.parse(pyproject_path.read_bytes())
-    except TOMLKitError as exc:
+        pyproject = load_toml(pyproject_content)
+    except TOMLDecodeError as exc:
         sys.exit(
             f"{Emoji.CROSS_MARK.value} Error: Could not parse the 'pyproject.toml' "
             f"file at: {pyproject_path}\nException: {exc}"
         )
 
+    project = pyproject.get("project", {})
+
     # Retrieve the minimum required Python version
     try:
-        py_version = get_min_max_py_version(
-            pyproject.get("project", {}).get("requires-python", "")
-        )
+        py_version = get_min_max_py_version(project.get("requires-python", ""))
     except UnableToResolve as exc:
         sys.exit(
             f"{Emoji.CROSS_MARK.value} Error: Cannot determine minimum Python version."
@@ -184,29 +678,157 @@ def update_deps(
     LOGGER.debug("Minimum required Python version: %s", py_version)
 
     # Retrieve the Python project's package name
-    project_name: str = pyproject.get("project", {}).get("name", "")
+    project_name: str = project.get("name", "")
     if not project_name:
         sys.exit(
             f"{Emoji.CROSS_MARK.value} Error: Could not find the Python project's name"
             " in 'pyproject.toml'."
         )
+    # Compare package names in their normalized form, e.g., 'CI_CD' is this project
+    canonical_project_name = canonicalize_name(project_name)
 
-    # Build the list of dependencies listed in pyproject.toml
-    dependencies: list[str] = pyproject.get("project", {}).get("dependencies", [])
-    for optional_deps in (
-        pyproject.get("project", {}).get("optional-dependencies", {}).values()
-    ):
-        dependencies.extend(optional_deps)
+    # Build the list of unique dependencies listed in pyproject.toml, in order
+    # Note: The arrays of the parsed pyproject.toml are only read, not extended, which
+    # would also update the document if parsed with tomlkit
+    dependencies: list[str] = list(
+        dict.fromkeys(
+            chain(
+                project.get("dependencies", []),
+                *project.get("optional-dependencies", {}).values(),
+            )
+        )
+    )
 
     # Placeholder and default variables
-    already_handled_packages: set[Requirement] = set()
     updated_packages: dict[str, str] = {}
     error: bool = False
+    # Parse the wildcard ignore rules once, and package-specific ignore rules only once
+    # per package
+    wildcard_ignore_rules: tuple[IgnoreVersions, IgnoreUpdateTypes] | None = (
+        parse_ignore_rules(ignore_rules["*"]) if "*" in ignore_rules else None
+    )
+    parsed_ignore_rules: dict[str, tuple[IgnoreVersions, IgnoreUpdateTypes]] = {}
+    # Console messages are collected and written in one go, instead of per dependency
+    messages: list[str] = []
+    error_messages: list[str] = []
+    # Dependency substitutions are collected and applied to pyproject.toml in one go,
+    # instead of per dependency
+    substitutions: dict[str, str] = {}
 
-    for dependency in dependencies:
-        try:
-            parsed_requirement = Requirement(dependency)
-        except InvalidRequirement as exc:
+    parsed_dependencies = [
+        _parse_dependency(dependency, requirement, py_version)
+        for dependency, requirement in _unique_requirements(dependencies)
+    ]
+
+    # Look up the latest version of all dependencies needing it concurrently, as each
+    # lookup is a separate 'pip index versions' subprocess (and network) call.
+    # The results are retrieved in order when handling the dependencies below.
+    # Differently spelled names of the same package, e.g., 'Foo_Bar' and 'foo-bar', are
+    # looked up only once, using the first spelling.
+    pip_index_lookups: dict[tuple[str, str], None] = {}
+    lookup_names: dict[str, str] = {}
+    for _, parsed_requirement, _, marker_py_version in parsed_dependencies:
+        if not isinstance(parsed_requirement, Requirement) or isinstance(
+            marker_py_version, UnableToResolve
+        ):
+            # Reported when handling the dependency below
+            continue
+        canonical_name = canonicalize_name(parsed_requirement.name)
+        if (
+            canonical_name == canonical_project_name
+            or parsed_requirement.url
+            or not parsed_requirement.specifier
+            or _is_unconditionally_ignored(
+                _user_ignore_rules(
+                    parsed_requirement.name,
+                    ignore_rules,
+                    wildcard_ignore_rules,
+                    parsed_ignore_rules,
+                )[0]
+            )
+        ):
+            continue
+        pip_index_lookups[
+            (
+                lookup_names.setdefault(canonical_name, parsed_requirement.name),
+                marker_py_version or py_version,
+            )
+        ] = None
+
+    # Use latest versions retrieved within the last LATEST_VERSIONS_CACHE_TTL seconds
+    # (also by previous runs), formatted as the 'pip index versions' output
+    # Note: The cache path is only determined if the cache is used, as it may depend on
+    # the home directory, which is not always available
+    latest_versions_cache_path = _latest_versions_cache_path() if cache else None
+    latest_versions_cache = (
+        _load_latest_versions_cache(latest_versions_cache_path)
+        if latest_versions_cache_path is not None
+        else {}
+    )
+    cached_pip_index_outputs: dict[tuple[str, str], str] = {}
+    uncached_lookups: list[tuple[str, str]] = []
+    for lookup in pip_index_lookups:
+        cache_key = _latest_versions_cache_key(*lookup, pypi_json_api)
+        if cache_key in latest_versions_cache:
+            LOGGER.debug("Using cached latest version for %r", cache_key)
+            cached_pip_index_outputs[lookup] = (
+                f"{lookup[0]} ({latest_versions_cache[cache_key][0]})"
+            )
+        else:
+            uncached_lookups.append(lookup)
+
+    # Only the lookups not answered by the cache need the network (and a thread pool)
+    pip_index_outputs: dict[tuple[str, str], Future[str]] = {}
+    # Whether to request JSON output from 'pip index versions' (pip 25.1+)
+    pip_index_json = True
+    if uncached_lookups:
+        with ThreadPoolExecutor(
+            max_workers=min(PIP_INDEX_MAX_WORKERS, len(uncached_lookups))
+        ) as executor:
+            for lookup in uncached_lookups:
+                if pypi_json_api:
+                    pip_index_outputs[lookup] = executor.submit(
+                        _pypi_json_api_versions, *lookup
+                    )
+                    continue
+
+                pip_index_outputs[lookup] = executor.submit(
+                    _pip_index_versions, context, *lookup, pip_index_json
+                )
+                if len(pip_index_outputs) == 1:
+                    # Await the first lookup to know whether '--json' is supported
+                    first_lookup = pip_index_outputs[lookup]
+                    if first_lookup.exception() is None:
+                        pip_index_json = first_lookup.result().lstrip().startswith("{")
+
+    if latest_versions_cache_path is not None and pip_index_outputs:
+        retrieved_at = time.time()
+        for lookup, future in pip_index_outputs.items():
+            if future.exception() is not None:
+                continue
+            latest_version_str = _parse_pip_index_versions(future.result())
+            if latest_version_str is None:
+                continue
+            try:
+                _parse_version(latest_version_str)
+            except InvalidVersion:
+                continue
+            latest_versions_cache[
+                _latest_versions_cache_key(*lookup, pypi_json_api)
+            ] = (
+                latest_version_str,
+                retrieved_at,
+            )
+        _save_latest_versions_cache(latest_versions_cache_path, latest_versions_cache)
+
+    for (
+        dependency,
+        parsed_requirement,
+        post_name_space,
+        marker_py_version,
+    ) in parsed_dependencies:
+        if isinstance(parsed_requirement, InvalidRequirement):
+            exc = parsed_requirement
             if skip_unnormalized_python_package_names:
                 msg = (
                     f"Skipping requirement {dependency!r}, as unnormalized Python "
@@ -214,7 +836,7 @@ def update_deps(
                     f"not be parsed: {exc}"
                 )
                 LOGGER.info(msg)
-                print(info_msg(msg), flush=True)
+                messages.append(info_msg(msg))
                 continue
 
             msg = (
@@ -223,30 +845,31 @@ def update_deps(
             )
             LOGGER.error(msg)
             if fail_fast:
+                _write_messages(messages)
+                _write_messages(error_messages, stderr=True)
+                _update_pyproject(pyproject_path, pyproject_content, substitutions)
                 sys.exit(f"{Emoji.CROSS_MARK.value} {error_msg(msg)}")
-            print(error_msg(msg), file=sys.stderr, flush=True)
+            error_messages.append(error_msg(msg))
             error = True
             continue
         LOGGER.debug("Parsed requirement: %r", parsed_requirement)
 
-        # Skip package if already handled
-        if parsed_requirement in already_handled_packages:
-            continue
-
         # Skip package if it is this project (this can happen for inter-relative extra
         # dependencies)
-        if parsed_requirement.name == project_name:
+        if canonicalize_name(parsed_requirement.name) == canonical_project_name:
             msg = (
                 f"Dependency {parsed_requirement.name!r} is detected as being this "
                 "project and will be skipped."
             )
             LOGGER.info(msg)
-            print(info_msg(msg), flush=True)
+            messages.append(info_msg(msg))
 
             _format_and_update_dependency(
-                parsed_requirement, dependency, pyproject_path
+                parsed_requirement,
+                dependency,
+                substitutions,
+                post_name_space=post_name_space,
             )
-            already_handled_packages.add(parsed_requirement)
             continue
 
         # Skip URL versioned dependencies
@@ -257,90 +880,132 @@ def update_deps(
                 "will be skipped."
             )
             LOGGER.info(msg)
-            print(info_msg(msg), flush=True)
+            messages.append(info_msg(msg))
 
             _format_and_update_dependency(
-                parsed_requirement, dependency, pyproject_path
+                parsed_requirement,
+                dependency,
+                substitutions,
+                post_name_space=post_name_space,
             )
-            already_handled_packages.add(parsed_requirement)
             continue
 
         # Skip and warn if package is not version-restricted
         # BUT do regenerate the dependency in order to have a consistent formatting
         if not parsed_requirement.specifier:
             # Only warn if package name does not match project name
-            if parsed_requirement.name != project_name:
+            if canonicalize_name(parsed_requirement.name) != canonical_project_name:
                 msg = (
                     f"Dependency {parsed_requirement.name!r} is not version "
                     "restricted and will be skipped. Consider adding version "
                     "restrictions."
                 )
                 LOGGER.warning(msg)
-                print(warning_msg(msg), flush=True)
+                messages.append(warning_msg(msg))
 
             _format_and_update_dependency(
-                parsed_requirement, dependency, pyproject_path
+                parsed_requirement,
+                dependency,
+                substitutions,
+                post_name_space=post_name_space,
             )
-            already_handled_packages.add(parsed_requirement)
             continue
 
-        # Examine markers for a custom set of Python version specifiers
-        marker_py_version = ""
-        if parsed_requirement.marker:
-            environment_keys = default_environment().keys()
-            empty_environment = dict.fromkeys(environment_keys, "")
-            python_version_centric_environment = empty_environment
-            python_version_centric_environment.update({"python_version": py_version})
+        # Gather the user-supplied ignore rules for the package
+        versions, update_types = _user_ignore_rules(
+            parsed_requirement.name,
+            ignore_rules,
+            wildcard_ignore_rules,
+            parsed_ignore_rules,
+        )
 
-            if not parsed_requirement.marker.evaluate(
-                environment=python_version_centric_environment
-            ):
-                # Current (minimum) Python version does NOT satisfy the marker
-                marker_py_version = find_minimum_py_version(
-                    marker=parsed_requirement.marker,
-                    project_py_version=py_version,
-                )
-            else:
-                marker_py_version = get_min_max_py_version(parsed_requirement.marker)
+        # Skip package altogether, without looking up its latest version, if all
+        # updates are ignored
+        if _is_unconditionally_ignored(versions):
+            LOGGER.debug(
+                "All updates are ignored for package %r. Skipping it.",
+                parsed_requirement.name,
+            )
+            continue
 
+        # Examine markers for a custom set of Python version specifiers (done once,
+        # when parsing the dependency)
+        if isinstance(marker_py_version, UnableToResolve):
+            msg = (
+                "Could not determine the Python version to use for "
+                f"{parsed_requirement.name!r} from its markers. Exception: "
+                f"{marker_py_version}"
+            )
+            LOGGER.error(msg)
+            if fail_fast:
+                _write_messages(messages)
+                _write_messages(error_messages, stderr=True)
+                _update_pyproject(pyproject_path, pyproject_content, substitutions)
+                sys.exit(f"{Emoji.CROSS_MARK.value} {error_msg(msg)}")
+            error_messages.append(error_msg(msg))
+            error = True
+            continue
+        if marker_py_version:
             LOGGER.debug("Min/max Python version from marker: %s", marker_py_version)
 
-        # Check version from PyPI's online package index
-        out: Result = context.run(
-            "pip index versions "
-            f"--python-version {marker_py_version or py_version} "
-            f"{parsed_requirement.name}",
-            hide=True,
-        )
-        package_latest_version_line = out.stdout.split(sep="\n", maxsplit=1)[0]
-        match = re.match(
-            r"(?P<package>\S+) \((?P<version>\S+)\)", package_latest_version_line
-        )
-        if match is None:
+        # Check version from PyPI's online package index (looked up beforehand)
+        try:
+            lookup = (
+                lookup_names[canonicalize_name(parsed_requirement.name)],
+                marker_py_version or py_version,
+            )
+            pip_index_output = (
+                cached_pip_index_outputs[lookup]
+                if lookup in cached_pip_index_outputs
+                else pip_index_outputs[lookup].result()
+            )
+        except UnableToResolve as exc:
+            msg = (
+                "Could not retrieve the latest version of "
+                f"{parsed_requirement.name!r}. Exception: {exc}"
+            )
+            LOGGER.error(msg)
+            if fail_fast:
+                _write_messages(messages)
+                _write_messages(error_messages, stderr=True)
+                _update_pyproject(pyproject_path, pyproject_content, substitutions)
+                sys.exit(f"{Emoji.CROSS_MARK.value} {error_msg(msg)}")
+            error_messages.append(error_msg(msg))
+            error = True
+            continue
+        latest_version_str = _parse_pip_index_versions(pip_index_output)
+        if latest_version_str is None:
+            output_line = pip_index_output.partition("\n")[0]
             msg = (
                 "Could not parse package and version from 'pip index versions' output "
-                f"for line:\n  {package_latest_version_line}"
+                f"for line:\n  {output_line}"
             )
             LOGGER.error(msg)
             if fail_fast:
+                _write_messages(messages)
+                _write_messages(error_messages, stderr=True)
+                _update_pyproject(pyproject_path, pyproject_content, substitutions)
                 sys.exit(f"{Emoji.CROSS_MARK.value} {error_msg(msg)}")
-            print(error_msg(msg), file=sys.stderr, flush=True)
-            already_handled_packages.add(parsed_requirement)
+            error_messages.append(error_msg(msg))
             error = True
             continue
 
         try:
-            latest_version = Version(match.group("version"))
+            latest_version = _parse_version(latest_version_str)
         except InvalidVersion as exc:
+            output_line = pip_index_output.partition("\n")[0]
             msg = (
-                f"Could not parse version {match.group('version')!r} from 'pip index "
-                f"versions' output for line:\n  {package_latest_version_line}.\n"
+                f"Could not parse version {latest_version_str!r} from 'pip index "
+                f"versions' output for line:\n  {output_line}.\n"
                 f"Exception: {exc}"
             )
             LOGGER.error(msg)
             if fail_fast:
+                _write_messages(messages)
+                _write_messages(error_messages, stderr=True)
+                _update_pyproject(pyproject_path, pyproject_content, substitutions)
                 sys.exit(f"{Emoji.CROSS_MARK.value} {error_msg(msg)}")
-            print(error_msg(msg), file=sys.stderr, flush=True)
+            error_messages.append(error_msg(msg))
             error = True
             continue
         LOGGER.debug("Retrieved latest version: %r", latest_version)
@@ -355,74 +1020,42 @@ def update_deps(
         # 'reQUEsts (<latest version here>)'.
 
         # Check whether pyproject.toml already uses the latest version
-        # This is expected if the latest version equals a specifier with any of the
-        # operators: ==, >=, or ~=.
-        split_latest_version = latest_version.base_version.split(".")
-        _continue = False
-        for specifier in parsed_requirement.specifier:
-            if specifier.operator in ["==", ">=", "~="]:
-                split_specifier_version = specifier.version.split(".")
-                equal_length_latest_version = split_latest_version[
-                    : len(split_specifier_version)
-                ]
-                if equal_length_latest_version == split_specifier_version:
-                    LOGGER.debug(
-                        "Package %r is already up-to-date. Specifiers: %s. "
-                        "Latest version: %s",
-                        parsed_requirement.name,
-                        parsed_requirement.specifier,
-                        latest_version,
-                    )
-                    already_handled_packages.add(parsed_requirement)
-                    _continue = True
-        if _continue:
+        up_to_date, current_version = _scan_specifier_set(
+            parsed_requirement.specifier, latest_version
+        )
+        if up_to_date:
+            LOGGER.debug(
+                "Package %r is already up-to-date. Specifiers: %s. Latest version: %s",
+                parsed_requirement.name,
+                parsed_requirement.specifier,
+                latest_version,
+            )
             continue
 
         # Create ignore rules based on specifier set
         requirement_ignore_rules = create_ignore_rules(parsed_requirement.specifier)
         if requirement_ignore_rules["versions"]:
-            if parsed_requirement.name in ignore_rules:
-                # Only "versions" key exists in requirement_ignore_rules
-                if "versions" in ignore_rules[parsed_requirement.name]:
-                    ignore_rules[parsed_requirement.name]["versions"].extend(
-                        requirement_ignore_rules["versions"]
-                    )
-                else:
-                    ignore_rules[parsed_requirement.name].update(
-                        requirement_ignore_rules
-                    )
-            else:
-                ignore_rules[parsed_requirement.name] = requirement_ignore_rules
             LOGGER.debug(
                 "Created ignore rules (from specifier set): %s",
                 requirement_ignore_rules,
             )
 
         # Apply ignore rules
-        if parsed_requirement.name in ignore_rules or "*" in ignore_rules:
-            versions: IgnoreVersions = []
-            update_types: IgnoreUpdateTypes = {}
-
-            if "*" in ignore_rules:
-                versions, update_types = parse_ignore_rules(ignore_rules["*"])
-
-            if parsed_requirement.name in ignore_rules:
-                parsed_rules = parse_ignore_rules(ignore_rules[parsed_requirement.name])
-
-                versions.extend(parsed_rules[0])
-                update_types.update(parsed_rules[1])
+        if (
+            parsed_requirement.name in ignore_rules
+            or wildcard_ignore_rules is not None
+            or requirement_ignore_rules["versions"]
+        ):
+            if requirement_ignore_rules["versions"]:
+                versions.extend(parse_ignore_rules(requirement_ignore_rules)[0])
 
             LOGGER.debug(
                 "Ignore rules:\nversions: %s\nupdate_types: %s", versions, update_types
             )
 
-            # Get "current" version from specifier set, i.e., the lowest allowed version
+            # The "current" version from the specifier set is the lowest allowed version
             # If a minimum version is not explicitly specified, use '0.0.0'
-            for specifier in parsed_requirement.specifier:
-                if specifier.operator in ["==", ">=", "~="]:
-                    current_version = specifier.version.split(".")
-                    break
-            else:
+            if current_version is None:
                 if latest_version.epoch == 0:
                     current_version = ["0", "0", "0"]
                 else:
@@ -430,11 +1063,10 @@ def update_deps(
 
             if ignore_version(
                 current=current_version,
-                latest=split_latest_version,
+                latest=latest_version.base_version.split("."),
                 version_rules=versions,
                 semver_rules=update_types,
             ):
-                already_handled_packages.add(parsed_requirement)
                 continue
 
         # Update specifier set to include the latest version.
@@ -451,9 +1083,11 @@ def update_deps(
             )
             LOGGER.error("%s. Exception: %s", msg, exc)
             if fail_fast:
+                _write_messages(messages)
+                _write_messages(error_messages, stderr=True)
+                _update_pyproject(pyproject_path, pyproject_content, substitutions)
                 sys.exit(f"{Emoji.CROSS_MARK.value} {error_msg(msg)}")
-            print(error_msg(msg), file=sys.stderr, flush=True)
-            already_handled_packages.add(parsed_requirement)
+            error_messages.append(error_msg(msg))
             error = True
             continue
 
@@ -461,32 +1095,27 @@ def update_deps(
             # Regenerate the full requirement string with the updated specifiers
             # Note: If any white space is present after the name (possibly incl.
             # extras) is reduced to a single space.
-            match = re.search(rf"{parsed_requirement.name}(?:\[.*\])?\s+", dependency)
             updated_dependency = regenerate_requirement(
                 parsed_requirement,
                 specifier=updated_specifier_set,
-                post_name_space=bool(match),
+                post_name_space=post_name_space,
             )
             LOGGER.debug("Updated dependency: %r", updated_dependency)
 
-            pattern_sub_line = re.escape(dependency)
-            replacement_sub_line = updated_dependency.replace('"', "'")
-
-            LOGGER.debug("pattern_sub_line: %s", pattern_sub_line)
-            LOGGER.debug("replacement_sub_line: %s", replacement_sub_line)
-
-            # Update pyproject.toml
-            update_file(pyproject_path, (pattern_sub_line, replacement_sub_line))
-            already_handled_packages.add(parsed_requirement)
+            # Update pyproject.toml (in one go, after all dependencies are handled)
+            substitutions[dependency] = updated_dependency
             updated_packages[parsed_requirement.name] = ",".join(
                 str(_)
                 for _ in sorted(
                     updated_specifier_set,
-                    key=lambda spec: spec.operator,
-                    reverse=True,
+                    key=lambda spec: SPECIFIER_OPERATOR_ORDER[spec.operator],
                 )
             ) + (f" ; {parsed_requirement.marker}" if parsed_requirement.marker else "")
 
+    _write_messages(messages)
+    _write_messages(error_messages, stderr=True)
+    _update_pyproject(pyproject_path, pyproject_content, substitutions)
+
     if error:
         sys.exit(
             f"{Emoji.CROSS_MARK.value} Errors occurred! See printed statements above."
@@ -504,3 +1133,72 @@ def update_deps(
         )
     else:
         print(f"{Emoji.CHECK_MARK.value} No dependency updates available.")
+
+
+@task(
+    help={
+        "fail-fast": (
+            "Fail immediately if an error occurs. Otherwise, print and ignore all "
+            "non-critical errors."
+        ),
+        "root-repo-path": (
+            "A resolvable path to the root directory of the repository folder."
+        ),
+        "pre-commit": "Whether or not this task is run as a pre-commit hook.",
+        "ignore": (
+            "Ignore-rules based on the `ignore` config option of Dependabot. It "
+            "should be of the format: key=value...key=value, i.e., an ellipsis "
+            "(`...`) separator and then equal-sign-separated key/value-pairs. "
+            "Alternatively, the `--ignore-separator` can be set to something else to "
+            "overwrite the ellipsis. The only supported keys are: `dependency-name`, "
+            "`versions`, and `update-types`. Can be supplied multiple times per "
+            "`dependency-name`."
+        ),
+        "ignore-separator": (
+            "Value to use instead of ellipsis (`...`) as a separator in `--ignore` "
+            "key/value-pairs."
+        ),
+        "verbose": "Whether or not to print debug statements.",
+        "skip-unnormalized-python-package-names": (
+            "Whether to skip dependencies with unnormalized Python package names. "
+            "Normalization is outlined here: "
+            "https://packaging.python.org/en/latest/specifications/name-normalization."
+        ),
+        "cache": (
+            "Whether to use and update the on-disk cache of latest versions. Cached "
+            "latest versions are used for up to an hour. Use `--no-cache` to always "
+            "look up the latest versions."
+        ),
+        "pypi-json-api": (
+            "Whether to retrieve the latest versions directly from PyPI's JSON API "
+            "instead of running `pip index versions`. Note, pip configuration, e.g., "
+            "a custom index URL, is not respected."
+        ),
+    },
+    iterable=["ignore"],
+)
+def update_deps(
+    context,
+    root_repo_path=".",
+    fail_fast=False,
+    pre_commit=False,
+    ignore=None,
+    ignore_separator="...",
+    verbose=False,
+    skip_unnormalized_python_package_names=False,
+    pypi_json_api=False,
+    cache=True,
+):
+    """Update dependencies in specified Python package's `pyproject.toml`."""
+    _run_update_deps(
+        context,
+        root_repo_path=root_repo_path,
+        fail_fast=fail_fast,
+        pre_commit=pre_commit,
+        ignore=ignore or [],
+        ignore_separator=ignore_separator,
+        verbose=verbose,
+        skip_unnormalized_python_package_names=skip_unnormalized_python_package_names,
+        pypi_json_api=pypi_json_api,
+        cache=cache,
+    )
@@ -9,16 +9,22 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:  # pragma: no cover
     from typing_extensions import Self
 
+IS_WINDOWS = platform.system() == "Windows"
+"""Whether the current platform is Windows, determined once on import."""
+
+ANSI_RESET = "\033[0m"
+"""ANSI escape sequence resetting all colors and formatting."""
+
 
 class Emoji(str, Enum):
     """Unicode strings for certain emojis."""
 
     def __new__(cls, value: str) -> Self:
         obj = str.__new__(cls, value)
-        if platform.system() == "Windows":
+        if IS_WINDOWS:
             # Windows does not support unicode emojis, so we replace them with
             # their corresponding unicode escape sequences
-            obj._value_ = value.encode("unicode_escape").decode("utf-8")
+            obj._value_ = value.encode("unicode_escape").decode("ascii")
         else:
             obj._value_ = value
         return obj
@@ -44,11 +50,11 @@ class Color(str, Enum):
     MAGENTA = "\033[95m"
     CYAN = "\033[96m"
     WHITE = "\033[97m"
-    RESET = "\033[0m"
+    RESET = ANSI_RESET
 
     def write(self, text: str) -> str:
         """Write the text with the color."""
-        return f"{self.value}{text}{Color.RESET.value}"
+        return self._value_ + text + ANSI_RESET
 
 
 class Formatting(str, Enum):
@@ -62,32 +68,37 @@ class Formatting(str, Enum):
     BOLD = "\033[1m"
     UNDERLINE = "\033[4m"
     INVERT = "\033[7m"
-    RESET = "\033[0m"
+    RESET = ANSI_RESET
 
     def write(self, text: str) -> str:
         """Write the text with the formatting."""
-        return f"{self.value}{text}{Formatting.RESET.value}"
+        return self._value_ + text + ANSI_RESET
+
+
+MESSAGE_PREFIXES = {
+    level: color.write(Formatting.BOLD.write(level)) + color.value + " - "
+    for level, color in (
+        ("ERROR", Color.RED),
+        ("WARNING", Color.YELLOW),
+        ("INFO", Color.BLUE),
+    )
+}
+"""Formatted beginnings of messages for each message level, built once on import.
+
+Each message is the colored and bold level name, followed by the colored text.
+"""
 
 
 def error_msg(text: str) -> str:
     """Write the text as an error message."""
-    return (
-        f"{Color.RED.write(Formatting.BOLD.write('ERROR'))}"
-        f"{Color.RED.write(' - ' + text)}"
-    )
+    return f"{MESSAGE_PREFIXES['ERROR']}{text}{ANSI_RESET}"
 
 
 def warning_msg(text: str) -> str:
     """Write the text as a warning message."""
-    return (
-        f"{Color.YELLOW.write(Formatting.BOLD.write('WARNING'))}"
-        f"{Color.YELLOW.write(' - ' + text)}"
-    )
+    return f"{MESSAGE_PREFIXES['WARNING']}{text}{ANSI_RESET}"
 
 
 def info_msg(text: str) -> str:
     """Write the text as an info message."""
-    return (
-        f"{Color.BLUE.write(Formatting.BOLD.write('INFO'))}"
-        f"{Color.BLUE.write(' - ' + text)}"
-    )
+    return f"{MESSAGE_PREFIXES['INFO']}{text}{ANSI_RESET}"
@@ -10,14 +10,33 @@ if TYPE_CHECKING:  # pragma: no cover
 
 
 def update_file(
-    filename: Path, sub_line: tuple[str, str], strip: str | None = None
+    filename: Path,
+    sub_line: tuple[str, str] | list[tuple[str, str]],
+    strip: str | None = None,
 ) -> None:
-    """Utility function for tasks to read, update, and write files"""
+    """Utility function for tasks to read, update, and write files.
+
+    Several `(pattern, replacement)` substitutions may be given as a list, in which
+    case they are applied in order, reading and writing the file only once.
+
+    Each pattern is compiled once and applied to each line separately, i.e., a
+    pattern never matches across lines.
+    """
     if strip is None and filename.suffix == ".md":
         # Keep special white space endings for markdown files
         strip = "\n"
-    lines = [
-        re.sub(sub_line[0], sub_line[1], line.rstrip(strip))
-        for line in filename.read_text(encoding="utf8").splitlines()
+
+    sub_lines = [
+        (re.compile(pattern), replacement)
+        for pattern, replacement in (
+            [sub_line] if isinstance(sub_line, tuple) else sub_line
+        )
     ]
+
+    lines = []
+    for line in filename.read_text(encoding="utf8").splitlines():
+        updated_line = line.rstrip(strip)
+        for pattern, replacement in sub_lines:
+            updated_line = pattern.sub(replacement, updated_line)
+        lines.append(updated_line)
     filename.write_text("\n".join(lines) + "\n", encoding="utf8")
@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 import operator
 import re
+from functools import lru_cache
 from typing import TYPE_CHECKING, NamedTuple, no_type_check
 
 from packaging.markers import Marker, default_environment
@@ -15,7 +16,7 @@ from ci_cd.exceptions import InputError, InputParserError, UnableToResolve
 
 if TYPE_CHECKING:  # pragma: no cover
     import sys
-    from typing import Any, Dict, List
+    from typing import Any, Dict, List, TypeVar
 
     if sys.version_info >= (3, 11):
         from typing import Self
@@ -35,6 +36,8 @@ if TYPE_CHECKING:  # pragma: no cover
         Literal["version-update"], List[Literal["major", "minor", "patch"]]
     ]
 
+    VersionPart = TypeVar("VersionPart", str, int)
+
 
 PART_TO_LENGTH_MAPPING = {
     "major": 1,
@@ -47,6 +50,25 @@ E.g., a minor version has two parts, so the length is `2`.
 """
 
 
+IGNORE_ENTRY_KEYS = frozenset(("dependency-name", "versions", "update-types"))
+"""The allowed keys of the key/value-pairs in an `--ignore` option value."""
+
+IGNORE_VERSIONS_RULE_PATTERN = re.compile(
+    r"^(?P<operator>>|<|<=|>=|==|!=|~=)\s*(?P<version>\S+)$"
+)
+"""Pattern to parse a `versions` ignore rule, i.e., an operator and a version."""
+
+IGNORE_UPDATE_TYPES_RULE_PREFIX = "version-update:semver-"
+"""The prefix of an `update-types` ignore rule, followed by the version part."""
+
+PYTHON_VERSION_MARKER_PATTERN = re.compile(
+    r"python_version\s*"
+    r"(?P<operator>==|!=|<=|>=|<|>|~=)\s*"
+    r"('|\")(?P<version>[0-9]+(?:\.[0-9]+)*)('|\")"
+)
+"""Pattern to find a `python_version` marker, i.e., an operator and a version."""
+
+
 class IgnoreEntryPair(NamedTuple):
     """A key/value-pair within an ignore entry."""
 
@@ -98,16 +120,29 @@ class SemanticVersion(str):
 
     """
 
-    _semver_regex = (
+    _semver_regex = re.compile(
         r"^(?P<major>0|[1-9]\d*)(?:\.(?P<minor>0|[1-9]\d*))?(?:\.(?P<patch>0|[1-9]\d*))?"
         r"(?:-(?P<pre_release>(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*)"
         r"(?:\.(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*))*))?"
         r"(?:\+(?P<build>[0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?$"
     )
-    """The regular expression for a semantic version.
+    """The (compiled) regular expression for a semantic version.
     See
     https://semver.org/#is-there-a-suggested-regular-expression-regex-to-check-a-semver-string."""
 
+    __slots__ = (
+        "_as_python_versions",
+        "_build",
+        "_full_version",
+        "_major",
+        "_minor",
+        "_patch",
+        "_pre_release",
+        "_precedence_key",
+        "_python_version",
+        "_shortened",
+    )
+
     @no_type_check
     def __new__(cls, version: str | Version | None = None, **kwargs: str | int) -> Self:
         return super().__new__(
@@ -128,6 +163,9 @@ class SemanticVersion(str):
         build: str | None = None,
     ) -> None:
         self._python_version: Version | None = None
+        self._full_version: str | None = None
+        self._shortened: str | None = None
+        self._as_python_versions: dict[bool, Version] = {}
 
         if version is not None:
             if major or minor or patch or pre_release or build:
@@ -139,39 +177,46 @@ class SemanticVersion(str):
                 self._python_version = version
                 version = ".".join(str(_) for _ in version.release)
 
-            match = re.match(self._semver_regex, version)
-            if match is None:
-                # Try to parse it as a Python version and try again
-                try:
-                    _python_version = Version(version)
-                except InvalidVersion as exc:
-                    raise ValueError(
-                        f"version ({version}) cannot be parsed as a semantic version "
-                        "according to the SemVer.org regular expression"
-                    ) from exc
-
-                # Success. Now let's redo the SemVer.org regular expression match
-                self._python_version = _python_version
-                match = re.match(
-                    self._semver_regex,
-                    ".".join(str(_) for _ in _python_version.release),
-                )
-                if match is None:  # pragma: no cover
-                    # This should not really be possible at this point, as the
-                    # Version.releasethis is a guaranteed match.
-                    # But we keep it here for sanity's sake.
-                    raise ValueError(
-                        f"version ({version}) cannot be parsed as a semantic version "
-                        "according to the SemVer.org regular expression"
-                    )
+            (
+                self._major,
+                self._minor,
+                self._patch,
+                self._pre_release,
+                self._build,
+                python_version,
+            ) = _parse_semantic_version(str.__str__(version))
+            if self._python_version is None:
+                self._python_version = python_version
+        else:
+            self._major = int(major)
+            self._minor = int(minor) if minor else 0
+            self._patch = int(patch) if patch else 0
+            self._pre_release = pre_release if pre_release else None
+            self._build = build if build else None
+
+        # Key for comparing precedence, see point 11 of the SemVer.org specification
+        # A version without a pre-release has higher precedence than one with
+        self._precedence_key: tuple[int, int, int, bool, str] = (
+            self._major,
+            self._minor,
+            self._patch,
+            self._pre_release is None,
+            self._pre_release or "",
+        )
 
-            major, minor, patch, pre_release, build = match.groups()
+    @classmethod
+    def get(cls, version: str | Version) -> SemanticVersion:
+        """Return a `SemanticVersion` for `version`, reusing instances (cached).
 
-        self._major = int(major)
-        self._minor = int(minor) if minor else 0
-        self._patch = int(patch) if patch else 0
-        self._pre_release = pre_release if pre_release else None
-        self._build = build if build else None
+        Contrary to calling the class directly, an instance of the class is returned
+        as is, and equal strings or Python versions return the same (shared) instance.
+        This is safe, as the instances are immutable.
+        """
+        if isinstance(version, cls):
+            return version
+        return _comparable_semantic_version(
+            cls, type(version), str(version)  # type: ignore[arg-type]
+        )
 
     @classmethod
     def _build_version(
@@ -247,7 +292,20 @@ class SemanticVersion(str):
         return self._python_version
 
     def as_python_version(self, shortened: bool = True) -> Version:
-        """Return the Python version as defined by `packaging.version.Version`."""
+        """Return the Python version as defined by `packaging.version.Version`.
+
+        The Python version is only generated once (per value of `shortened`), as the
+        instance is immutable.
+        """
+        shortened = bool(shortened)
+        if shortened not in self._as_python_versions:
+            self._as_python_versions[shortened] = self._generate_python_version(
+                shortened
+            )
+        return self._as_python_versions[shortened]
+
+    def _generate_python_version(self, shortened: bool) -> Version:
+        """Generate the Python version as defined by `packaging.version.Version`."""
         if not self.python_version:
             return Version(
                 self.shortened()
@@ -291,14 +349,20 @@ class SemanticVersion(str):
         return Version(redone_version)
 
     def __str__(self) -> str:
-        """Return the full version."""
-        if self.python_version:
-            return str(self.as_python_version(shortened=False))
-        return (
-            f"{self.major}.{self.minor}.{self.patch}"
-            f"{f'-{self.pre_release}' if self.pre_release else ''}"
-            f"{f'+{self.build}' if self.build else ''}"
-        )
+        """Return the full version.
+
+        The full version is only generated once, as the instance is immutable.
+        """
+        if self._full_version is None:
+            if self.python_version:
+                self._full_version = str(self.as_python_version(shortened=False))
+            else:
+                self._full_version = (
+                    f"{self.major}.{self.minor}.{self.patch}"
+                    f"{f'-{self.pre_release}' if self.pre_release else ''}"
+                    f"{f'+{self.build}' if self.build else ''}"
+                )
+        return self._full_version
 
     def __repr__(self) -> str:
         """Return the string representation of the object."""
@@ -340,56 +404,44 @@ class SemanticVersion(str):
 
     def _validate_other_type(self, other: Any) -> SemanticVersion:
         """Initial check/validation of `other` before rich comparisons."""
-        not_implemented_exc = NotImplementedError(
-            f"Rich comparison not implemented between {self.__class__.__name__} and "
-            f"{type(other)}"
-        )
-
-        if isinstance(other, self.__class__):
+        if type(other) is self.__class__ or isinstance(other, self.__class__):
             return other
 
         if isinstance(other, (Version, str)):
             try:
-                return self.__class__(other)
+                return (
+                    self.__class__.get(other)
+                    if type(other) in (str, Version)
+                    else self.__class__(other)
+                )
             except (TypeError, ValueError) as exc:
-                raise not_implemented_exc from exc
+                raise NotImplementedError(
+                    "Rich comparison not implemented between "
+                    f"{self.__class__.__name__} and {type(other)}"
+                ) from exc
 
-        raise not_implemented_exc
+        raise NotImplementedError(
+            f"Rich comparison not implemented between {self.__class__.__name__} and "
+            f"{type(other)}"
+        )
 
     def __lt__(self, other: Any) -> bool:
         """Less than (`<`) rich comparison."""
         other_semver = self._validate_other_type(other)
 
-        if self.major < other_semver.major:
-            return True
-        if self.major == other_semver.major:
-            if self.minor < other_semver.minor:
-                return True
-            if self.minor == other_semver.minor:
-                if self.patch < other_semver.patch:
-                    return True
-                if self.patch == other_semver.patch:
-                    if self.pre_release is None:
-                        return False
-                    if other_semver.pre_release is None:
-                        return True
-                    return self.pre_release < other_semver.pre_release
-        return False
+        return self._precedence_key < other_semver._precedence_key
 
     def __le__(self, other: Any) -> bool:
         """Less than or equal to (`<=`) rich comparison."""
-        return self.__lt__(other) or self.__eq__(other)
+        other_semver = self._validate_other_type(other)
+
+        return self._precedence_key <= other_semver._precedence_key
 
     def __eq__(self, other: object) -> bool:
         """Equal to (`==`) rich comparison."""
         other_semver = self._validate_other_type(other)
 
-        return (
-            self.major == other_semver.major
-            and self.minor == other_semver.minor
-            and self.patch == other_semver.patch
-            and self.pre_release == other_semver.pre_release
-        )
+        return self._precedence_key == other_semver._precedence_key
 
     def __ne__(self, other: object) -> bool:
         """Not equal to (`!=`) rich comparison."""
@@ -397,11 +449,15 @@ class SemanticVersion(str):
 
     def __ge__(self, other: Any) -> bool:
         """Greater than or equal to (`>=`) rich comparison."""
-        return not self.__lt__(other)
+        other_semver = self._validate_other_type(other)
+
+        return self._precedence_key >= other_semver._precedence_key
 
     def __gt__(self, other: Any) -> bool:
         """Greater than (`>`) rich comparison."""
-        return not self.__le__(other)
+        other_semver = self._validate_other_type(other)
+
+        return self._precedence_key > other_semver._precedence_key
 
     def next_version(self, version_part: str) -> SemanticVersion:
         """Return the next version for the specified version part.
@@ -422,14 +478,12 @@ class SemanticVersion(str):
                 f"{version_part!r}"
             )
 
+        # Create the version from its parts, as there is no need to parse a string
         if version_part == "major":
-            next_version = f"{self.major + 1}.0.0"
-        elif version_part == "minor":
-            next_version = f"{self.major}.{self.minor + 1}.0"
-        else:
-            next_version = f"{self.major}.{self.minor}.{self.patch + 1}"
-
-        return self.__class__(next_version)
+            return self.__class__(major=self.major + 1, minor=0, patch=0)
+        if version_part == "minor":
+            return self.__class__(major=self.major, minor=self.minor + 1, patch=0)
+        return self.__class__(major=self.major, minor=self.minor, patch=self.patch + 1)
 
     def previous_version(
         self, version_part: str, max_filler: str | int | None = None
@@ -482,15 +536,101 @@ class SemanticVersion(str):
         The shortened version is the full version, but without the patch and/or minor
         version if they are `0`, and without the pre-release and build metadata parts.
 
+        The shortened version is only generated once, as the instance is immutable.
+
         Returns:
             The shortened version.
 
         """
-        if self.patch == 0:
-            if self.minor == 0:
-                return str(self.major)
-            return f"{self.major}.{self.minor}"
-        return f"{self.major}.{self.minor}.{self.patch}"
+        if self._shortened is None:
+            if self.patch != 0:
+                self._shortened = f"{self.major}.{self.minor}.{self.patch}"
+            elif self.minor != 0:
+                self._shortened = f"{self.major}.{self.minor}"
+            else:
+                self._shortened = str(self.major)
+        return self._shortened
+
+
+@lru_cache(maxsize=1024)
+def _comparable_semantic_version(
+    cls: type[SemanticVersion], version_type: type, version: str
+) -> SemanticVersion:
+    """Create a `SemanticVersion` from a string or Python version (cached).
+
+    This avoids creating a new instance for every comparison against the same value,
+    e.g., when sorting or searching. The instances can be shared, as they are immutable.
+    Use `SemanticVersion.get()` instead of calling this function directly.
+
+    The cache is keyed on the type and string value of the given version, since
+    Python versions compare equal for different strings, e.g., `1.0` and `1.0.0`.
+    """
+    if issubclass(version_type, Version):
+        return cls(Version(version))
+    return cls(version)
+
+
+@lru_cache(maxsize=4096)
+def _parse_semantic_version(
+    version: str,
+) -> tuple[int, int, int, str | None, str | None, Version | None]:
+    """Parse a version string into the parts of a `SemanticVersion` (cached).
+
+    If the version is not a semantic version according to the SemVer.org regular
+    expression, it is parsed as a Python version, and its release is used instead.
+
+    Returns:
+        The major, minor, and patch versions, the pre-release and build metadata parts,
+        as well as the Python version, if the version was parsed as such.
+
+    Raises:
+        ValueError: If the version can be parsed as neither a semantic version nor a
+            Python version.
+
+    """
+    # Fast path for plain numeric versions, e.g., '1.2.3', without leading zeros
+    parts = version.split(".")
+    if len(parts) <= PART_TO_LENGTH_MAPPING["patch"] and all(
+        part == "0" or ("1" <= part[:1] <= "9" and part.isdecimal()) for part in parts
+    ):
+        numbers = [int(part) for part in parts] + [0, 0]
+        return numbers[0], numbers[1], numbers[2], None, None, None
+
+    python_version: Version | None = None
+
+    match = SemanticVersion._semver_regex.match(version)
+    if match is None:
+        # Try to parse it as a Python version and try again
+        try:
+            python_version = Version(version)
+        except InvalidVersion as exc:
+            raise ValueError(
+                f"version ({version}) cannot be parsed as a semantic version "
+                "according to the SemVer.org regular expression"
+            ) from exc
+
+        # Success. Now let's redo the SemVer.org regular expression match
+        match = SemanticVersion._semver_regex.match(
+            ".".join(str(_) for _ in python_version.release)
+        )
+        if match is None:  # pragma: no cover
+            # This should not really be possible at this point, as the
+            # Version.releasethis is a guaranteed match.
+            # But we keep it here for sanity's sake.
+            raise ValueError(
+                f"version ({version}) cannot be parsed as a semantic version "
+                "according to the SemVer.org regular expression"
+            )
+
+    major, minor, patch, pre_release, build = match.groups()
+    return (
+        int(major),
+        int(minor) if minor else 0,
+        int(patch) if patch else 0,
+        pre_release if pre_release else None,
+        build if build else None,
+        python_version,
+    )
 
 
 def parse_ignore_entries(entries: list[str], separator: str) -> IgnoreRulesCollection:
@@ -511,28 +651,24 @@ def parse_ignore_entries(entries: list[str], separator: str) -> IgnoreRulesColle
     ignore_entries: IgnoreRulesCollection = {}
 
     for entry in entries:
-        pairs = entry.split(separator, maxsplit=2)
-        for pair in pairs:
-            if separator in pair:
-                raise InputParserError(
-                    "More than three key/value-pairs were given for an `--ignore` "
-                    "option, while there are only three allowed key names. Input "
-                    f"value: --ignore={entry!r}"
-                )
+        pairs = entry.split(separator)
+        if len(pairs) > len(IGNORE_ENTRY_KEYS):
+            raise InputParserError(
+                "More than three key/value-pairs were given for an `--ignore` "
+                "option, while there are only three allowed key names. Input "
+                f"value: --ignore={entry!r}"
+            )
 
         ignore_entry: IgnoreEntry = {}
         for pair in pairs:
-            match = re.match(
-                r"^(?P<key>dependency-name|versions|update-types)=(?P<value>.*)$",
-                pair,
-            )
-            if match is None:
+            key, equal_sign, value = pair.partition("=")
+            if not equal_sign or key not in IGNORE_ENTRY_KEYS:
                 raise InputParserError(
                     f"Could not parse ignore configuration: {pair!r} (part of the "
                     f"ignore option: {entry!r})"
                 )
 
-            parsed_pair = IgnoreEntryPair(**match.groupdict())  # type: ignore[arg-type]
+            parsed_pair = IgnoreEntryPair(key, value)  # type: ignore[arg-type]
 
             if parsed_pair.key in ignore_entry:
                 raise InputParserError(
@@ -549,17 +685,12 @@ def parse_ignore_entries(entries: list[str], separator: str) -> IgnoreRulesColle
                 f"configuration. Ignore option entry: {entry}"
             )
 
-        dependency_name = ignore_entry["dependency-name"]
-        if dependency_name not in ignore_entries:
-            ignore_entries[dependency_name] = {
-                key: [value]
-                for key, value in ignore_entry.items()
-                if key != "dependency-name"
-            }
-        else:
-            for key, value in ignore_entry.items():
-                if key != "dependency-name":
-                    ignore_entries[dependency_name][key].append(value)
+        dependency_rules = ignore_entries.setdefault(
+            ignore_entry["dependency-name"], {}
+        )
+        for key, value in ignore_entry.items():
+            if key != "dependency-name":
+                dependency_rules.setdefault(key, []).append(value)
 
     return ignore_entries
 
@@ -585,10 +716,7 @@ def parse_ignore_rules(
 
     if "versions" in rules:
         for versions_entry in rules["versions"]:
-            match = re.match(
-                r"^(?P<operator>>|<|<=|>=|==|!=|~=)\s*(?P<version>\S+)$",
-                versions_entry,
-            )
+            match = IGNORE_VERSIONS_RULE_PATTERN.match(versions_entry)
             if match is None:
                 raise InputParserError(
                     "Ignore option's 'versions' value cannot be parsed. It "
@@ -600,11 +728,11 @@ def parse_ignore_rules(
     if "update-types" in rules:
         update_types["version-update"] = []
         for update_type_entry in rules["update-types"]:
-            match = re.match(
-                r"^version-update:semver-(?P<semver_part>major|minor|patch)$",
-                update_type_entry,
-            )
-            if match is None:
+            semver_part = update_type_entry[len(IGNORE_UPDATE_TYPES_RULE_PREFIX) :]
+            if (
+                not update_type_entry.startswith(IGNORE_UPDATE_TYPES_RULE_PREFIX)
+                or semver_part not in PART_TO_LENGTH_MAPPING
+            ):
                 raise InputParserError(
                     "Ignore option's 'update-types' value cannot be parsed."
                     " It must be either: 'version-update:semver-major', "
@@ -612,7 +740,7 @@ def parse_ignore_rules(
                     "'version-update:semver-patch'.\nUnparseable 'update-types' "
                     f"value: {update_type_entry!r}"
                 )
-            update_types["version-update"].append(match.group("semver_part"))  # type: ignore[arg-type]
+            update_types["version-update"].append(semver_part)  # type: ignore[arg-type]
 
     return versions, update_types
 
@@ -644,7 +772,7 @@ def _ignore_version_rules_semver(
     NOTE: While this function is currently not used, it is intended to be kept for a
         future support of multiple frameworks (not just Python/pip).
     """
-    semver_latest = SemanticVersion(".".join(latest))
+    semver_latest = SemanticVersion.get(".".join(latest))
     operators_mapping = {
         ">": operator.gt,
         "<": operator.lt,
@@ -657,7 +785,7 @@ def _ignore_version_rules_semver(
     decision_version_rules = []
     for version_rule in version_rules:
         decision_version_rule = False
-        semver_version_rule = SemanticVersion(version_rule["version"])
+        semver_version_rule = SemanticVersion.get(version_rule["version"])
 
         if version_rule["operator"] in operators_mapping:
             if operators_mapping[version_rule["operator"]](
@@ -714,46 +842,77 @@ def _ignore_version_rules_specifier_set(
     if not version_rules:
         return False
 
+    specifier_set = _version_rules_specifier_set(
+        ",".join(f"{_['operator']}{_['version']}" for _ in version_rules)
+    )
+    return SemanticVersion.get(".".join(latest)) in specifier_set
+
+
+@lru_cache(maxsize=512)
+def _version_rules_specifier_set(specifiers: str) -> SpecifierSet:
+    """Create a specifier set from the joined `versions` ignore rules (cached).
+
+    NOTE: The returned specifier set is shared between calls, and must not be mutated.
+
+    Raises:
+        InputError: If the rules cannot be parsed as a specifier set.
+
+    """
     try:
-        specifier_set = SpecifierSet(
-            ",".join(f"{_['operator']}{_['version']}" for _ in version_rules)
-        )
+        return SpecifierSet(specifiers)
     except InvalidSpecifier as exc:
         raise InputError("Invalid version specifier") from exc
-    return SemanticVersion(".".join(latest)) in specifier_set
+
+
+def _version_parts_as_ints(parts: list[str]) -> list[int] | None:
+    """Convert version parts to integers.
+
+    Returns:
+        The version parts as integers, or `None` if any of the parts is not a plain
+        integer, e.g., if it includes an epoch or a wildcard.
+
+    """
+    if all(part.isdecimal() for part in parts):
+        return [int(part) for part in parts]
+    return None
 
 
 def _ignore_semver_rules(
-    current: list[str],
-    latest: list[str],
+    current: list[VersionPart],
+    latest: list[VersionPart],
     semver_rules: IgnoreUpdateTypes,
 ) -> bool:
-    """If ANY of the semver rules are True, ignore the version."""
-    if any(
-        _ not in ["major", "minor", "patch"] for _ in semver_rules["version-update"]
-    ):
+    """If ANY of the semver rules are True, ignore the version.
+
+    The version parts should preferably be given as integers, in order for them to be
+    compared numerically.
+    """
+    update_rules = frozenset(semver_rules["version-update"])
+    if not update_rules.issubset(PART_TO_LENGTH_MAPPING):
         raise InputParserError(
             f"Only valid values for 'version-update' are 'major', 'minor', and "
             f"'patch' (you gave {semver_rules['version-update']!r})."
         )
 
-    return bool(
-        ("major" in semver_rules["version-update"] and latest[0] != current[0])
-        or (
-            "minor" in semver_rules["version-update"]
-            and len(latest) >= PART_TO_LENGTH_MAPPING["minor"]
-            and len(current) >= PART_TO_LENGTH_MAPPING["minor"]
-            and latest[1] > current[1]
-            and latest[0] == current[0]
-        )
-        or (
-            "patch" in semver_rules["version-update"]
-            and len(latest) >= PART_TO_LENGTH_MAPPING["patch"]
-            and len(current) >= PART_TO_LENGTH_MAPPING["patch"]
-            and latest[2] > current[2]
-            and latest[0] == current[0]
-            and latest[1] == current[1]
-        )
+    if "major" in update_rules and latest[0] != current[0]:
+        return True
+
+    # The number of version parts available for comparison in both versions
+    compared_length = min(len(latest), len(current))
+
+    if (
+        "minor" in update_rules
+        and compared_length >= PART_TO_LENGTH_MAPPING["minor"]
+        and latest[0] == current[0]
+        and latest[1] > current[1]
+    ):
+        return True
+
+    return (
+        "patch" in update_rules
+        and compared_length >= PART_TO_LENGTH_MAPPING["patch"]
+        and latest[:2] == current[:2]
+        and latest[2] > current[2]
     )
 
 
@@ -785,14 +944,19 @@ def ignore_version(
         return True
 
     # version rules
-    if _ignore_version_rules_specifier_set(latest, version_rules):
+    if version_rules and _ignore_version_rules_specifier_set(latest, version_rules):
         return True
 
     # semver rules
-    return bool(
-        "version-update" in semver_rules
-        and _ignore_semver_rules(current, latest, semver_rules)
-    )
+    if "version-update" not in semver_rules:
+        return False
+
+    # Compare the version parts numerically, if possible
+    current_ints = _version_parts_as_ints(current)
+    latest_ints = _version_parts_as_ints(latest)
+    if current_ints is not None and latest_ints is not None:
+        return _ignore_semver_rules(current_ints, latest_ints, semver_rules)
+    return _ignore_semver_rules(current, latest, semver_rules)
 
 
 def regenerate_requirement(
@@ -834,11 +998,13 @@ def regenerate_requirement(
         if specifier and not isinstance(specifier, SpecifierSet):
             specifier = SpecifierSet(specifier)
         updated_dependency += ",".join(
-            str(_)
-            for _ in sorted(
-                specifier or requirement.specifier,
-                key=lambda spec: spec.operator,
-                reverse=True,
+            map(
+                str,
+                sorted(
+                    specifier or requirement.specifier,
+                    key=operator.attrgetter("operator"),
+                    reverse=True,
+                ),
             )
         )
 
@@ -853,13 +1019,19 @@ def regenerate_requirement(
     return updated_dependency
 
 
+@lru_cache(maxsize=1024)
+def _parse_python_version(version: str) -> Version:
+    """Parse a specifier's version string as a Python version (cached)."""
+    return Version(version)
+
+
 def update_specifier_set(
     latest_version: SemanticVersion | Version | str, current_specifier_set: SpecifierSet
 ) -> SpecifierSet:
     """Update the specifier set to include the latest version."""
     logger = logging.getLogger(__name__)
 
-    latest_version = SemanticVersion(latest_version)
+    latest_version = SemanticVersion.get(latest_version)
 
     new_specifier_set = set(current_specifier_set)
     updated_specifiers = []
@@ -868,7 +1040,15 @@ def update_specifier_set(
         if latest_version.python_version
         else latest_version.split(".")
     )
-    current_version_epochs = {Version(_.version).epoch for _ in current_specifier_set}
+    current_version_epochs = {
+        _parse_python_version(_.version).epoch for _ in current_specifier_set
+    }
+    latest_epoch = (
+        latest_version.as_python_version().epoch
+        if latest_version.python_version
+        else None
+    )
+    latest_epoch_prefix = f"{latest_epoch}!" if latest_epoch else ""
 
     logger.debug(
         "Received latest version: %s and current specifier set: %s",
@@ -895,18 +1075,13 @@ def update_specifier_set(
             # non-empty, but include only an empty string.
             updated_specifiers.append("")
 
-    elif (
-        latest_version.python_version
-        and latest_version.as_python_version().epoch not in current_version_epochs
-    ):
+    elif latest_epoch is not None and latest_epoch not in current_version_epochs:
         # The latest version is *not* included in the specifier set.
         # And the latest version is NOT in the same epoch as the current version range.
 
         # Sanity check that the latest version's epoch is larger than the largest
         # epoch in the specifier set.
-        if current_version_epochs and latest_version.as_python_version().epoch < max(
-            current_version_epochs
-        ):
+        if current_version_epochs and latest_epoch < max(current_version_epochs):
             raise UnableToResolve(
                 "The latest version's epoch is smaller than the largest epoch in "
                 "the specifier set."
@@ -938,14 +1113,8 @@ def update_specifier_set(
                 # version up from the latest version
                 split_specifier_version = specifier.version.split(".")
 
-                updated_version = ""
-
                 # Add epoch if present
-                if (
-                    latest_version.python_version
-                    and latest_version.as_python_version().epoch != 0
-                ):
-                    updated_version += f"{latest_version.as_python_version().epoch}!"
+                updated_version = latest_epoch_prefix
 
                 # Up only the last version segment of the latest version according to
                 # what version segments are defined in the specifier version.
@@ -971,15 +1140,10 @@ def update_specifier_set(
                 # Expand and change ~= to >= and < operators if the latest version
                 # changes major version. Otherwise, update to include latest version as
                 # the minimum version
-                current_version = SemanticVersion(specifier.version)
+                current_version = SemanticVersion.get(specifier.version)
 
                 # Add epoch if present
-                epoch = ""
-                if (
-                    latest_version.python_version
-                    and latest_version.as_python_version().epoch != 0
-                ):
-                    epoch += f"{latest_version.as_python_version().epoch}!"
+                epoch = latest_epoch_prefix
 
                 if latest_version.major > current_version.major:
                     # Expand and change ~= to >= and < operators
@@ -1030,18 +1194,47 @@ def _semi_valid_python_version(version: SemanticVersion) -> bool:
     is raised.
 
     """
-    if version.major not in range(1, 3 + 1):
+    if not 1 <= version.major <= 3:
         # Not a valid Python major version (1, 2, or 3)
         raise ValueError(
             f"Invalid Python major version: {version.major}. Expected 1, 2, or 3."
         )
 
-    # Either:
-    #   Not a valid Python minor version (0, 1, 2, ..., 12)
-    #   Not a valid Python patch version (0, 1, 2, ..., 18)
-    return not bool(
-        version.minor not in range(12 + 1) or version.patch not in range(18 + 1)
-    )
+    # Both:
+    #   A valid Python minor version (0, 1, 2, ..., 12)
+    #   A valid Python patch version (0, 1, 2, ..., 18)
+    return 0 <= version.minor <= 12 and 0 <= version.patch <= 18
+
+
+def _clamp_python_version(version: SemanticVersion, min_or_max: str) -> SemanticVersion:
+    """Move a version that is not a semi-valid Python version to the nearest one.
+
+    For `"min"`, the next semi-valid version up is returned, while for `"max"`, the
+    previous semi-valid version down is returned.
+    See `_semi_valid_python_version()` for the valid ranges of the version parts.
+    Semi-valid versions are returned as is.
+
+    Raises:
+        UnableToResolve: If the search has passed the highest (or lowest) valid Python
+            version, i.e., the major version is no longer 1, 2, or 3.
+
+    """
+    if min_or_max == "min":
+        if version.patch > 18:
+            version = version.next_version("minor")
+        if version.minor > 12:
+            version = version.next_version("major")
+    elif version.minor > 12:
+        version = SemanticVersion(major=version.major, minor=12, patch=18)
+    elif version.patch > 18:
+        version = SemanticVersion(major=version.major, minor=version.minor, patch=18)
+
+    if not 1 <= version.major <= 3:
+        raise UnableToResolve(
+            f"Searched past the valid Python versions (reached {version}) without "
+            "finding a Python version that satisfies the requirements."
+        )
+    return version
 
 
 def get_min_max_py_version(
@@ -1074,12 +1267,7 @@ def get_min_max_py_version(
 
     """
     if isinstance(requires_python, Marker):
-        match = re.search(
-            r"python_version\s*"
-            r"(?P<operator>==|!=|<=|>=|<|>|~=)\s*"
-            r"('|\")(?P<version>[0-9]+(?:\.[0-9]+)*)('|\")",
-            str(requires_python),
-        )
+        match = PYTHON_VERSION_MARKER_PATTERN.search(str(requires_python))
 
         if match is None:
             raise UnableToResolve("Could not retrieve 'python_version' marker.")
@@ -1110,7 +1298,7 @@ def get_min_max_py_version(
 
         if specifier.operator == ">":
             split_version = specifier.version.split(".")
-            parsed_version = SemanticVersion(specifier.version)
+            parsed_version = SemanticVersion.get(specifier.version)
 
             if len(split_version) == PART_TO_LENGTH_MAPPING["major"]:
                 py_version = str(parsed_version.next_version("major").major)
@@ -1133,9 +1321,9 @@ def get_min_max_py_version(
 
             if specifier.operator == "<":
                 split_version = specifier.version.split(".")
-                parsed_version = SemanticVersion(specifier.version)
+                parsed_version = SemanticVersion.get(specifier.version)
 
-                if parsed_version == SemanticVersion("0"):
+                if parsed_version == SemanticVersion.get("0"):
                     raise UnableToResolve(
                         f"{specifier} is not a valid Python version specifier."
                     )
@@ -1164,7 +1352,7 @@ def get_min_max_py_version(
 
     if py_version not in specifier_set:
         split_py_version = py_version.split(".")
-        parsed_py_version = SemanticVersion(py_version)
+        parsed_py_version = SemanticVersion.get(py_version)
 
         # See the _semi_valid_python_version() function for these values
         largest_value_for_a_patch_part = 18
@@ -1193,6 +1381,8 @@ def get_min_max_py_version(
                     max_filler=largest_value_for_any_part,
                 )
 
+            # Skip directly past any versions that are not semi-valid
+            parsed_py_version = _clamp_python_version(parsed_py_version, min_or_max)
             py_version = parsed_py_version.shortened()
             split_py_version = py_version.split(".")
 
@@ -1210,7 +1400,7 @@ def find_minimum_py_version(marker: Marker, project_py_version: str) -> str:
             return _version.next_version("minor")
         return _version.next_version("patch")
 
-    min_py_version = SemanticVersion(project_py_version)
+    min_py_version = SemanticVersion.get(project_py_version)
 
     environment_keys = default_environment().keys()
     empty_environment = dict.fromkeys(environment_keys, "")
@@ -1220,7 +1410,7 @@ def find_minimum_py_version(marker: Marker, project_py_version: str) -> str:
     while not _semi_valid_python_version(min_py_version) or not marker.evaluate(
         environment=python_version_centric_environment
     ):
-        min_py_version = _next_version(min_py_version)
+        min_py_version = _clamp_python_version(_next_version(min_py_version), "min")
         python_version_centric_environment.update({"python_version": min_py_version})
 
     return min_py_version.shortened()
@@ -22,3 +22,11 @@ def _clear_loggers() -> None:
         handlers = getattr(logger, "handlers", [])
         for handler in handlers:
             logger.removeHandler(handler)
+
+
+@pytest.fixture(autouse=True)
+def _latest_versions_cache_dir(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Use a separate (empty) cache directory for each test"""
+    monkeypatch.setenv("CI_CD_CACHE_DIR", str(tmp_path_factory.mktemp("cache")))
@@ -95,6 +95,44 @@ def test_setver(tmp_path: Path) -> None:
     assert (package_dir / "__init__.py").read_text() == '__version__ = "0.1.0"\n'
 
 
+def test_setver_with_several_code_base_updates_per_file(tmp_path: Path) -> None:
+    """Test setver applies several code_base_update inputs for the same file in
+    order."""
+    from invoke import MockContext
+
+    from ci_cd.tasks.setver import setver
+
+    # Create __init__.py file
+    package_dir = tmp_path / "src" / "my_package"
+    package_dir.mkdir(parents=True)
+    (package_dir / "__init__.py").write_text("__version__ = '0.0.0'\n")
+
+    # Create a file to update
+    file_to_update = package_dir / "file_to_update"
+    file_to_update.write_text("version = '0.0.0'\nrelease = 'v0.0.0'\n")
+
+    new_version = "0.1.0"
+
+    # Run setver
+    setver(
+        MockContext(),
+        package_dir=package_dir.relative_to(tmp_path),
+        version=new_version,
+        root_repo_path=tmp_path,
+        code_base_update=[
+            f"{file_to_update.resolve()},^version = '.*',version = '{{version}}'",
+            f"{file_to_update.resolve()},^release = 'v.*',release = 'v{{version}}'",
+            f"{file_to_update.resolve()},^release = '(.*)',release = '\\1-final'",
+        ],
+        code_base_update_separator=",",
+    )
+
+    assert (
+        file_to_update.read_text()
+        == f"version = '{new_version}'\nrelease = 'v{new_version}-final'\n"
+    )
+
+
 @pytest.mark.parametrize(
     ("version", "expected_version"),
     compliant_python_version_schemes,
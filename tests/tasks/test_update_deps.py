@@ -8,6 +8,7 @@ import pytest
 
 if TYPE_CHECKING:
     from pathlib import Path
+    from typing import Any
 
 
 def test_update_deps(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
@@ -423,15 +424,28 @@ dev = [
 
 
 def test_python_version_marker(
-    tmp_path: Path, caplog: pytest.LogCaptureFixture
+    tmp_path: Path, caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     """Check the python version marker is respected."""
+    import importlib
     import re
 
     from invoke import MockContext
 
     from ci_cd.tasks.update_deps import update_deps
 
+    # Note: `ci_cd.tasks.update_deps` is shadowed by the task in `ci_cd.tasks`
+    update_deps_module = importlib.import_module("ci_cd.tasks.update_deps")
+    marker_py_version_calls: list[str] = []
+
+    def spy_marker_py_version(requirement: Any, py_version: str) -> str:
+        """Record the requirements the marker Python version is determined for."""
+        marker_py_version_calls.append(str(requirement))
+        return original_marker_py_version(requirement, py_version)
+
+    original_marker_py_version = update_deps_module._marker_py_version
+    monkeypatch.setattr(update_deps_module, "_marker_py_version", spy_marker_py_version)
+
     pyproject_file = tmp_path / "pyproject.toml"
     pyproject_file.write_text(
         data="""
@@ -477,6 +491,9 @@ dependencies = [
     assert "Min/max Python version from marker: 3.7" in caplog.text
     assert "Min/max Python version from marker: 3.8" in caplog.text
 
+    # The Python version of the markers is determined only once per dependency
+    assert len(marker_py_version_calls) == 2, marker_py_version_calls
+
 
 def test_no_warn_when_project_name(
     tmp_path: Path, caplog: pytest.LogCaptureFixture
@@ -894,6 +911,458 @@ dependencies = [
     assert pyproject_file.read_text(encoding="utf8") == pyproject_file_data
 
 
+@pytest.mark.parametrize("json_supported", [True, False])
+def test_pip_index_versions_json(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture, json_supported: bool
+) -> None:
+    """Check the JSON output of `pip index versions` is used if supported, and that
+    the human-readable output is used otherwise."""
+    import re
+
+    from invoke import MockContext, Result
+
+    from ci_cd.tasks.update_deps import update_deps
+
+    pyproject_file = tmp_path / "pyproject.toml"
+    pyproject_file.write_text(
+        data="""[project]
+name = "ci-cd"
+requires-python = "~=3.8"
+
+dependencies = [
+    "pytest ~=7.0",
+    "numpy ~=1.20",
+    "invoke ~=1.7",
+]
+""",
+        encoding="utf8",
+    )
+
+    class StdinlessMockContext(MockContext):
+        """Mock context ensuring commands are run without mirroring stdin."""
+
+        def run(self, command: str, **kwargs: Any) -> Result:
+            assert kwargs.get("in_stream") is False, command
+            return super().run(command, **kwargs)
+
+    if json_supported:
+        context = StdinlessMockContext(
+            run={
+                re.compile(rf"^pip index versions --json .*{package}$"): (
+                    f'{{"name": "{package}", "versions": ["{version}"], '
+                    f'"latest": "{version}"}}'
+                )
+                for package, version in [
+                    ("pytest", "8.0.0"),
+                    ("numpy", "1.26.4"),
+                    ("invoke", "2.2.0"),
+                ]
+            }
+        )
+    else:
+        context = StdinlessMockContext(
+            run={
+                re.compile(r"^pip index versions --json .*pytest$"): Result(
+                    stderr="ERROR: no such option: --json", exited=2
+                ),
+                # After the failed `--json` call, it must not be used again
+                **{
+                    re.compile(
+                        rf"^pip index versions --python-version 3.8 {package}$"
+                    ): (f"{package} ({version})")
+                    for package, version in [
+                        ("pytest", "8.0.0"),
+                        ("numpy", "1.26.4"),
+                        ("invoke", "2.2.0"),
+                    ]
+                },
+            }
+        )
+
+    update_deps(context, root_repo_path=str(tmp_path))
+
+    assert (
+        "'pip index versions' does not support '--json'." in caplog.text
+    ) is not json_supported
+    assert pyproject_file.read_text(encoding="utf8") == """[project]
+name = "ci-cd"
+requires-python = "~=3.8"
+
+dependencies = [
+    "pytest >=7.0.0,<9",
+    "numpy ~=1.26",
+    "invoke >=1.7.0,<3",
+]
+"""
+
+
+def test_pypi_json_api(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Check the latest versions can be retrieved from PyPI's JSON API."""
+    import importlib
+    import io
+    import json
+
+    from invoke import MockContext
+
+    from ci_cd.tasks.update_deps import update_deps
+
+    pypi_releases = {
+        "pytest": {
+            "7.4.4": [{"requires_python": ">=3.7", "yanked": False}],
+            # Yanked
+            "7.5.0": [{"requires_python": ">=3.7", "yanked": True}],
+            # Pre-release
+            "8.0.0rc1": [{"requires_python": ">=3.8", "yanked": False}],
+            # Python version not supported
+            "8.0.0": [{"requires_python": ">=3.9", "yanked": False}],
+        },
+        "invoke": {
+            "1.7.3": [{"requires_python": None, "yanked": False}],
+            "2.2.0": [{"requires_python": ">=3.6", "yanked": False}],
+        },
+    }
+
+    def mock_urlopen(url: str, **_: Any) -> io.BytesIO:
+        """Mock `urlopen()` returning the JSON API response for a package."""
+        name = url.split("/")[-2]
+        if name not in pypi_releases:
+            raise OSError(f"HTTP Error 404: Not Found ({url})")
+        return io.BytesIO(json.dumps({"releases": pypi_releases[name]}).encode())
+
+    # Note: `ci_cd.tasks.update_deps` is shadowed by the task in `ci_cd.tasks`
+    monkeypatch.setattr(
+        importlib.import_module("ci_cd.tasks.update_deps"), "urlopen", mock_urlopen
+    )
+
+    pyproject_file = tmp_path / "pyproject.toml"
+    pyproject_file.write_text(
+        data="""[project]
+name = "ci-cd"
+requires-python = "~=3.8"
+
+dependencies = [
+    "pytest ~=7.0",
+    "invoke ~=1.7",
+]
+""",
+        encoding="utf8",
+    )
+
+    # No `pip index versions` calls are expected
+    update_deps(MockContext(), root_repo_path=str(tmp_path), pypi_json_api=True)
+
+    assert pyproject_file.read_text(encoding="utf8") == """[project]
+name = "ci-cd"
+requires-python = "~=3.8"
+
+dependencies = [
+    "pytest ~=7.4",
+    "invoke >=1.7.0,<3",
+]
+"""
+
+    # Unknown package
+    pyproject_file.write_text(
+        data="""[project]
+name = "ci-cd"
+requires-python = "~=3.8"
+
+dependencies = ["unknown-package ~=1.0"]
+""",
+        encoding="utf8",
+    )
+
+    with pytest.raises(SystemExit, match=r"Could not retrieve the latest version"):
+        update_deps(
+            MockContext(),
+            root_repo_path=str(tmp_path),
+            fail_fast=True,
+            pypi_json_api=True,
+        )
+
+
+def test_unnormalized_project_name_dependency(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Check a dependency on this project is detected regardless of normalization."""
+    import re
+
+    from invoke import MockContext
+
+    from ci_cd.tasks.update_deps import update_deps
+
+    pyproject_file = tmp_path / "pyproject.toml"
+    pyproject_file_data = """[project]
+name = "ci-cd"
+requires-python = "~=3.8"
+
+dependencies = ["pytest ~=8.0"]
+
+[project.optional-dependencies]
+dev = ["CI_CD[docs] >=1.0"]
+"""
+    pyproject_file.write_text(data=pyproject_file_data, encoding="utf8")
+
+    # Any call to `pip index versions` for CI_CD would raise NotImplementedError
+    context = MockContext(run={re.compile(r".*pytest$"): "pytest (8.0.0)"})
+
+    update_deps(context, root_repo_path=str(tmp_path))
+
+    assert (
+        "Dependency 'CI_CD' is detected as being this project and will be skipped."
+        in caplog.text
+    )
+    assert pyproject_file.read_text(encoding="utf8") == pyproject_file_data
+
+
+def test_non_python_version_marker(tmp_path: Path) -> None:
+    """Check markers not concerning the Python version do not affect the lookup."""
+    import re
+
+    from invoke import MockContext
+
+    from ci_cd.tasks.update_deps import update_deps
+
+    pyproject_file = tmp_path / "pyproject.toml"
+    pyproject_file.write_text(
+        data="""[project]
+name = "ci-cd"
+requires-python = "~=3.8"
+
+dependencies = [
+    "pywin32 >=300; sys_platform == 'win32'",
+    "uvloop ~=0.17; sys_platform != 'win32'",
+]
+""",
+        encoding="utf8",
+    )
+
+    context = MockContext(
+        run={
+            re.compile(r".*--python-version 3.8 pywin32$"): "pywin32 (306)",
+            re.compile(r".*--python-version 3.8 uvloop$"): "uvloop (0.19.0)",
+        }
+    )
+
+    update_deps(context, root_repo_path=str(tmp_path))
+
+    assert pyproject_file.read_text(encoding="utf8") == """[project]
+name = "ci-cd"
+requires-python = "~=3.8"
+
+dependencies = [
+    "pywin32 >=300; sys_platform == 'win32'",
+    "uvloop ~=0.19; sys_platform != 'win32'",
+]
+"""
+
+
+def test_preserve_pyproject_formatting(tmp_path: Path) -> None:
+    """Check comments and string types are preserved when updating dependencies."""
+    import re
+
+    from invoke import MockContext
+
+    from ci_cd.tasks.update_deps import update_deps
+
+    pyproject_file = tmp_path / "pyproject.toml"
+    pyproject_file.write_text(
+        data="""[project]
+name = "ci-cd"
+requires-python = "~=3.8"
+
+dependencies = [
+    # Testing
+    "pytest ~=7.0",  # Keep this comment
+    'numpy ~=1.20; python_version >= "3.8"',
+]
+
+[project.optional-dependencies]
+dev = ["pytest ~=7.0"]
+""",
+        encoding="utf8",
+    )
+
+    context = MockContext(
+        run={
+            re.compile(r".*pytest$"): "pytest (8.0.0)",
+            re.compile(r".*numpy$"): "numpy (1.26.4)",
+        }
+    )
+
+    update_deps(context, root_repo_path=str(tmp_path))
+
+    assert pyproject_file.read_text(encoding="utf8") == """[project]
+name = "ci-cd"
+requires-python = "~=3.8"
+
+dependencies = [
+    # Testing
+    "pytest >=7.0.0,<9",  # Keep this comment
+    'numpy ~=1.26; python_version >= "3.8"',
+]
+
+[project.optional-dependencies]
+dev = ["pytest >=7.0.0,<9"]
+"""
+
+
+def test_latest_versions_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Check retrieved latest versions are cached on disk and reused."""
+    import importlib
+    import pathlib
+    import re
+
+    from invoke import MockContext
+
+    from ci_cd.tasks.update_deps import update_deps
+
+    pyproject_file = tmp_path / "pyproject.toml"
+    original_pyproject_file_data = """[project]
+name = "ci-cd"
+requires-python = "~=3.8"
+
+dependencies = ["pytest ~=7.0"]
+"""
+    updated_pyproject_file_data = original_pyproject_file_data.replace(
+        "pytest ~=7.0", "pytest >=7.0.0,<9"
+    )
+
+    pyproject_file.write_text(data=original_pyproject_file_data, encoding="utf8")
+    update_deps(
+        MockContext(run={re.compile(r".*pytest$"): "pytest (8.0.0)"}),
+        root_repo_path=str(tmp_path),
+    )
+    assert pyproject_file.read_text(encoding="utf8") == updated_pyproject_file_data
+
+    # The cached latest version is used, i.e., `pip index versions` is not called
+    pyproject_file.write_text(data=original_pyproject_file_data, encoding="utf8")
+    update_deps(MockContext(), root_repo_path=str(tmp_path))
+    assert pyproject_file.read_text(encoding="utf8") == updated_pyproject_file_data
+
+    # The cache is not used with `--no-cache`
+    with pytest.raises(NotImplementedError, match=r"pytest$"):
+        update_deps(MockContext(), root_repo_path=str(tmp_path), cache=False)
+
+    # The latest versions from `pip index versions` are not used for PyPI's JSON API
+    def mock_urlopen(url: str, **_: Any) -> None:
+        """Mock `urlopen()` failing to retrieve the package information."""
+        raise OSError(f"HTTP Error 503: Service Unavailable ({url})")
+
+    # Note: `ci_cd.tasks.update_deps` is shadowed by the task in `ci_cd.tasks`
+    monkeypatch.setattr(
+        importlib.import_module("ci_cd.tasks.update_deps"), "urlopen", mock_urlopen
+    )
+    with pytest.raises(SystemExit, match=r"Could not retrieve the latest version"):
+        update_deps(
+            MockContext(),
+            root_repo_path=str(tmp_path),
+            fail_fast=True,
+            pypi_json_api=True,
+        )
+
+    # The cache directory (possibly the home directory) is not needed with
+    # `--no-cache`
+    def mock_home() -> Path:
+        """Mock `Path.home()` failing, e.g., without a `HOME` or passwd entry."""
+        raise RuntimeError("Could not determine home directory.")
+
+    monkeypatch.delenv("CI_CD_CACHE_DIR")
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    monkeypatch.setattr(pathlib.Path, "home", mock_home)
+    pyproject_file.write_text(data=original_pyproject_file_data, encoding="utf8")
+    update_deps(
+        MockContext(run={re.compile(r".*pytest$"): "pytest (8.0.0)"}),
+        root_repo_path=str(tmp_path),
+        cache=False,
+    )
+    assert pyproject_file.read_text(encoding="utf8") == updated_pyproject_file_data
+
+
+@pytest.mark.parametrize(
+    "ignore_rule", ["dependency-name=numpy", "dependency-name=*"], ids=["numpy", "*"]
+)
+def test_fully_ignored_dependency_not_looked_up(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture, ignore_rule: str
+) -> None:
+    """Check the latest version is not retrieved for a dependency ignoring all
+    updates."""
+    import re
+
+    from invoke import MockContext
+
+    from ci_cd.tasks.update_deps import update_deps
+
+    pyproject_file = tmp_path / "pyproject.toml"
+    pyproject_file_data = """[project]
+name = "ci-cd"
+requires-python = "~=3.8"
+
+dependencies = [
+    "numpy >=1.20,!=1.21.0",
+]
+"""
+    pyproject_file.write_text(data=pyproject_file_data, encoding="utf8")
+
+    # Any call to `pip index versions` for numpy would raise NotImplementedError
+    context = MockContext(run={re.compile(r".*pytest$"): "pytest (7.0.10)"})
+
+    update_deps(context, root_repo_path=str(tmp_path), ignore=[ignore_rule])
+
+    assert "All updates are ignored for package 'numpy'." in caplog.text
+    assert pyproject_file.read_text(encoding="utf8") == pyproject_file_data
+
+
+def test_differently_spelled_dependency_looked_up_once(tmp_path: Path) -> None:
+    """Check the latest version is retrieved only once for differently spelled names
+    of the same package."""
+    import re
+
+    from invoke import MockContext
+
+    from ci_cd.tasks.update_deps import update_deps
+
+    pyproject_file = tmp_path / "pyproject.toml"
+    pyproject_file.write_text(
+        data="""[project]
+name = "ci-cd"
+requires-python = "~=3.8"
+
+dependencies = [
+    "Typing_Extensions ~=4.0",
+]
+
+[project.optional-dependencies]
+dev = [
+    "typing-extensions ~=4.1",
+]
+""",
+        encoding="utf8",
+    )
+
+    # Any call to `pip index versions` for typing-extensions would raise
+    # NotImplementedError
+    context = MockContext(
+        run={re.compile(r".*Typing_Extensions$"): "Typing_Extensions (4.12.2)"}
+    )
+
+    update_deps(context, root_repo_path=str(tmp_path))
+
+    assert pyproject_file.read_text(encoding="utf8") == """[project]
+name = "ci-cd"
+requires-python = "~=3.8"
+
+dependencies = [
+    "Typing_Extensions ~=4.12",
+]
+
+[project.optional-dependencies]
+dev = [
+    "typing-extensions ~=4.12",
+]
+"""
+
+
 @pytest.mark.parametrize("pre_commit", [True, False])
 def test_pre_commit(tmp_path: Path, pre_commit: bool) -> None:
     """Check pre-commit toggle."""
@@ -1182,3 +1651,67 @@ all = ["{{ cookiecutter.project_slug }}[dev]"]
 """
 
     assert pyproject_file.read_text(encoding="utf8") == expected_pyproject_file_data
+
+
+@pytest.mark.parametrize("fail_fast", [True, False])
+def test_unsatisfiable_python_version_marker(
+    tmp_path: Path,
+    fail_fast: bool,
+    caplog: pytest.LogCaptureFixture,
+    capsys: pytest.CaptureFixture,
+) -> None:
+    """Ensure an error is reported if no Python version satisfies a dependency's
+    `python_version` marker, e.g., for a stale backport dependency."""
+    import re
+
+    from invoke import MockContext
+
+    from ci_cd.tasks.update_deps import update_deps
+    from ci_cd.utils.console_printing import Emoji, error_msg
+
+    pyproject_file_data = """[project]
+name = "ci-cd"
+requires-python = ">=3.11"
+
+dependencies = [
+    "pytest ~=7.4",
+    "tomli >=2; python_version < '3.11'",
+]
+"""
+    pyproject_file = tmp_path / "pyproject.toml"
+    pyproject_file.write_text(data=pyproject_file_data, encoding="utf8")
+
+    # tomli is not looked up
+    context = MockContext(run={re.compile(r".*pytest$"): "pytest (8.1.1)"})
+
+    core_msg = (
+        "Could not determine the Python version to use for 'tomli' from its markers. "
+        "Exception: Searched past the valid Python versions (reached 4.0.0) without "
+        "finding a Python version that satisfies the requirements."
+    )
+    terminal_msg = re.compile(re.escape(error_msg(core_msg)))
+
+    if fail_fast:
+        raise_msg = (
+            f"^{re.escape(Emoji.CROSS_MARK.value)} {re.escape(error_msg(core_msg))}$"
+        )
+    else:
+        raise_msg = (
+            rf"^{re.escape(Emoji.CROSS_MARK.value)} Errors occurred! See printed "
+            r"statements above\.$"
+        )
+
+    with pytest.raises(SystemExit, match=raise_msg):
+        update_deps(context, root_repo_path=str(tmp_path), fail_fast=fail_fast)
+
+    # The dependencies handled before the error are still updated
+    assert pyproject_file.read_text(encoding="utf8") == pyproject_file_data.replace(
+        "pytest ~=7.4", "pytest >=7.4.0,<9"
+    )
+
+    assert core_msg in caplog.text, caplog.text
+
+    if fail_fast:
+        assert terminal_msg.search(capsys.readouterr().err) is None, terminal_msg
+    else:
+        assert terminal_msg.search(capsys.readouterr().err) is not None, terminal_msg
@@ -0,0 +1,68 @@
+"""Tests for utils/file_io.py"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.mark.parametrize(
+    ("content", "sub_line", "expected_content"),
+    [
+        ("a = 1   \n\nb = 2\n", (r"\s+$", ""), "a = 1\n\nb = 2\n"),
+        ("x = [\n  'a',\n]\n", (r"\[\s*'", "['"), "x = [\n  'a',\n]\n"),
+        ("a\nb\n", (r"a\nb", "c"), "a\nb\n"),
+        ("a = 1\nb = x\n", (r"a = [^x]*", "a = 2"), "a = 2\nb = x\n"),
+    ],
+    ids=["trailing white space", "white space", "newline", "negated class"],
+)
+def test_update_file_does_not_match_across_lines(
+    tmp_path: Path, content: str, sub_line: tuple[str, str], expected_content: str
+) -> None:
+    """Ensure patterns are applied to each line separately."""
+    from ci_cd.utils.file_io import update_file
+
+    filename = tmp_path / "file.py"
+    filename.write_text(content, encoding="utf8")
+
+    update_file(filename, sub_line)
+
+    assert filename.read_text(encoding="utf8") == expected_content
+
+
+def test_update_file_several_substitutions(tmp_path: Path) -> None:
+    """Ensure several substitutions are applied in order to each line."""
+    from ci_cd.utils.file_io import update_file
+
+    filename = tmp_path / "file.py"
+    filename.write_text('version = "1.0.0"  \nname = "test"\n', encoding="utf8")
+
+    update_file(
+        filename,
+        [
+            (r'version = "[^"]*"', 'version = "2.0.0"'),
+            (r"2\.0\.0", r"\g<0>rc1"),
+            (r"^name", "package_name"),
+        ],
+    )
+
+    assert (
+        filename.read_text(encoding="utf8")
+        == 'version = "2.0.0rc1"\npackage_name = "test"\n'
+    )
+
+
+def test_update_file_markdown(tmp_path: Path) -> None:
+    """Ensure trailing white space is kept in markdown files."""
+    from ci_cd.utils.file_io import update_file
+
+    filename = tmp_path / "README.md"
+    filename.write_text("Version 1.0.0  \nNext line\n\n", encoding="utf8")
+
+    update_file(filename, (r"1\.0\.0", "2.0.0"))
+
+    assert filename.read_text(encoding="utf8") == "Version 2.0.0  \nNext line\n\n"
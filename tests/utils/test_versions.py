@@ -174,6 +174,97 @@ def test_semanticversion_invalid_comparisons() -> None:
             operators_mapping[operator_](SemanticVersion("1.0.0"), "test")
 
 
+def test_semanticversion_comparisons() -> None:
+    """Test rich comparisons follow the SemVer.org precedence."""
+    from ci_cd.utils.versions import SemanticVersion
+
+    # Ordered by increasing precedence
+    versions = [
+        SemanticVersion(version)
+        for version in (
+            "0.9.9",
+            "1.0.0-alpha",
+            "1.0.0-beta",
+            "1.0.0",
+            "1.0.1",
+            "1.1.0",
+            "1.10.0",
+            "2.0.0",
+        )
+    ]
+
+    for index, version in enumerate(versions):
+        for other_index, other in enumerate(versions):
+            assert (version < other) is (index < other_index), (version, other)
+            assert (version <= other) is (index <= other_index), (version, other)
+            assert (version == other) is (index == other_index), (version, other)
+            assert (version != other) is (index != other_index), (version, other)
+            assert (version >= other) is (index >= other_index), (version, other)
+            assert (version > other) is (index > other_index), (version, other)
+
+    # Build metadata does not affect precedence
+    assert SemanticVersion("1.0.0+build.1") == "1.0.0+build.2"
+    assert sorted(versions[4:] + versions[:4]) == versions
+
+
+def test_semanticversion_parse_cache() -> None:
+    """Test SemanticVersion parses the same version string only once."""
+    from packaging.version import Version
+
+    from ci_cd.utils.versions import SemanticVersion, _parse_semantic_version
+
+    _parse_semantic_version.cache_clear()
+
+    for version in ("1.2.3-rc.1+build.5", "1.2.3-rc.1+build.5", "1!2.0.post1"):
+        SemanticVersion(version)
+
+    assert _parse_semantic_version.cache_info().hits == 1
+    assert _parse_semantic_version.cache_info().misses == 2
+
+    # Cached parts are set on each instance, incl. the Python version
+    semver = SemanticVersion("1.2.3-rc.1+build.5")
+    assert (semver.major, semver.minor, semver.patch) == (1, 2, 3)
+    assert (semver.pre_release, semver.build) == ("rc.1", "build.5")
+    assert semver.python_version is None
+    assert SemanticVersion("1!2.0.post1").python_version == Version("1!2.0.post1")
+
+    # A given Python version is kept, even if its release is cached
+    python_version = Version("2.0")
+    assert SemanticVersion(python_version).python_version is python_version
+
+
+def test_semanticversion_get() -> None:
+    """Test SemanticVersion.get() reuses instances."""
+    from packaging.version import Version
+
+    from ci_cd.utils.versions import SemanticVersion
+
+    semver = SemanticVersion("1.2.3")
+    assert SemanticVersion.get(semver) is semver
+
+    assert SemanticVersion.get("1.2") is SemanticVersion.get("1.2")
+    assert SemanticVersion.get("1.2") < semver
+    assert SemanticVersion.get(Version("1!2.0")) is SemanticVersion.get(
+        Version("1!2.0")
+    )
+    assert SemanticVersion.get(Version("1!2.0")).python_version == Version("1!2.0")
+
+    # Equal versions with different string values are not mixed up
+    short_version = SemanticVersion.get("1.0")
+    full_version = SemanticVersion.get(Version("1.0.0"))
+    assert str.__str__(short_version) != str.__str__(full_version)
+    assert str.__str__(full_version) == "1.0.0"
+    assert full_version.python_version == Version("1.0.0")
+
+    short_python_version = SemanticVersion.get(Version("1.0"))
+    assert short_python_version is not short_version
+    assert str.__str__(short_python_version) == "1.0"
+    assert str.__str__(SemanticVersion.get(Version("1.0.0"))) == "1.0.0"
+
+    with pytest.raises(ValueError, match=r"cannot be parsed as a semantic version"):
+        SemanticVersion.get("invalid")
+
+
 def test_semanticversion_next_version() -> None:
     """Test the next_version method of SemanticVersion class."""
     from ci_cd.utils.versions import SemanticVersion
@@ -333,6 +424,8 @@ def _parametrize_ignore_version() -> (
         ("1.1.1", "2.2.1", [], {"version-update": ["patch"]}, False),
         ("1.1.1", "1.2.1", [], {"version-update": ["minor"]}, True),
         ("1.1.1", "1.1.2", [], {"version-update": ["patch"]}, True),
+        ("1.9.1", "1.10.0", [], {"version-update": ["minor"]}, True),
+        ("1.1.9", "1.1.10", [], {"version-update": ["patch"]}, True),
         (
             "1.1.1",
             "2.2.2",
@@ -975,6 +1068,11 @@ Instead, ignore_version() is {not expected_outcome}
             },
         ),
         (["dependency-name=test"], "...", {"test": {}}),
+        (
+            ["dependency-name=test", "dependency-name=test;versions=>2.2.2"],
+            ";",
+            {"test": {"versions": [">2.2.2"]}},
+        ),
     ],
 )
 def test_parse_ignore_entries(
@@ -1060,6 +1158,35 @@ Instead, parse_ignore_rules() returned:
 """
 
 
+def test_parse_ignore_fails() -> None:
+    """Ensure `InputParserError` is raised for unparseable ignore options."""
+    from ci_cd.exceptions import InputParserError
+    from ci_cd.utils.versions import parse_ignore_entries, parse_ignore_rules
+
+    for entry in ("dependency-name", "dependency_name=test", "=test"):
+        with pytest.raises(
+            InputParserError, match=r"^Could not parse ignore configuration"
+        ):
+            parse_ignore_entries(entries=[entry], separator="...")
+
+    with pytest.raises(InputParserError, match=r"^More than three key/value-pairs"):
+        parse_ignore_entries(
+            entries=["dependency-name=test...versions=>2...versions=<3...versions=<4"],
+            separator="...",
+        )
+
+    for update_type in (
+        "version-update:semver-build",
+        "version-update:major",
+        "semver-major",
+    ):
+        with pytest.raises(
+            InputParserError,
+            match=r"^Ignore option's 'update-types' value cannot be parsed",
+        ):
+            parse_ignore_rules(rules={"update-types": [update_type]})
+
+
 def test_ignore_version_fails() -> None:
     """Ensure `InputParserError` is raised for unknown ignore options."""
     from ci_cd.exceptions import InputError, InputParserError
@@ -1128,6 +1255,7 @@ def test_ignore_version_fails() -> None:
         ("<3.6", "3.5"),
         ("<3.6.5", "3.6.4"),
         ("<3.6.5,!=3.6.4", "3.6.3"),
+        ("<3.0,!=2", "1.12.18"),
     ],
     ids=[
         ">=3.6",
@@ -1152,6 +1280,7 @@ def test_ignore_version_fails() -> None:
         "<3.6",
         "<3.6.5",
         "<3.6.5,!=3.6.4",
+        "<3.0,!=2",
     ],
 )
 def test_get_min_max_py_version(requires_python: str, expected_outcome: str) -> None:
@@ -1166,3 +1295,25 @@ def test_get_min_max_py_version(requires_python: str, expected_outcome: str) ->
         test_value = Marker(requires_python)
 
     assert get_min_max_py_version(test_value) == expected_outcome
+
+
+@pytest.mark.parametrize(
+    ("marker", "project_py_version", "expected_outcome"),
+    [
+        ("python_version >= '3.7'", "3.6", "3.7"),
+        ("python_version >= '3.7'", "3.6.1", "3.7"),
+        ("python_version < '3.7'", "3.6.1", "3.6.1"),
+        ("python_version >= '3'", "2.12", "3"),
+    ],
+)
+def test_find_minimum_py_version(
+    marker: str, project_py_version: str, expected_outcome: str
+) -> None:
+    """Test `find_minimum_py_version()`."""
+    from packaging.markers import Marker
+
+    from ci_cd.utils.versions import find_minimum_py_version
+
+    assert (
+        find_minimum_py_version(Marker(marker), project_py_version) == expected_outcome
+    )